@@ -7,17 +7,20 @@
 # 1. Edit DEFAULT_LIMITS below to change the repository-wide defaults.
 # 2. Override specific values at runtime with environment variables
 #    (INITIAL_BATCHES, SEARCHES_PER_BATCH, FILTERED_COUNT, MAX_RETRY_ROUNDS,
-#     SEARCH_GENERATE_WORKERS, SEARCH_EXECUTE_WORKERS).
+#     SEARCH_GENERATE_WORKERS, SEARCH_EXECUTE_WORKERS, RETRY_CACHE_TTL,
+#     REFINE_TOKEN_BUDGET, SEARCH_BATCH_SIZE).
 # Update DEFAULT_LIMITS for persistent changes; use environment variables for
 # one-off experiments.
 # ---------------------------------------------------------------------------
 
 from __future__ import annotations
 
+import functools
 import os
+import stat
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Mapping
+from typing import Dict, Iterable, Mapping
 
 
 DEFAULT_LIMITS: Dict[str, int] = {
@@ -25,18 +28,49 @@ DEFAULT_LIMITS: Dict[str, int] = {
     "per_batch": 25,  # Candidate searches expected per generation batch.
     "max_retry_rounds": 3,  # Max regenerate/execute cycles when below quota.
     "worker_pool_size": 6,  # Thread pool size shared across parallel tasks.
+    "retry_cache_ttl": 3600,  # Seconds a cached retry-generation response stays valid.
+    "generation_cache_ttl": 3600,  # Seconds cached generate/filter responses stay valid.
+    "refine_token_budget": 8000,  # Estimated prompt tokens per refinement call.
+    "search_batch_size": 1,  # Same-strategy searches sent in one web request.
 }
 
 
-def _env_bool(var_name: str, default: bool) -> bool:
+_created_dirs: set[Path] = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Creates the directory only when a stat call shows it is missing."""
+    if directory in _created_dirs:
+        return
+    try:
+        status = os.stat(directory)
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+    else:
+        if not stat.S_ISDIR(status.st_mode):
+            raise NotADirectoryError(f"Expected a directory at {directory}.")
+    # An existing directory implies its ancestors exist as well.
+    _created_dirs.add(directory)
+    _created_dirs.update(directory.parents)
+
+
+def _ensure_dirs(directories: Iterable[Path]) -> None:
+    """Ensures each unique directory exists, visiting the deepest paths first."""
+    for directory in sorted(
+        set(directories), key=lambda path: len(path.parts), reverse=True
+    ):
+        _ensure_dir(directory)
+
+
+def _env_bool(env: Mapping[str, str], var_name: str, default: bool) -> bool:
     """Returns a boolean for the provided environment variable name."""
-    raw_value = os.getenv(var_name)
+    raw_value = env.get(var_name)
     if raw_value is None:
         return default
     return raw_value.lower() in {"1", "true", "yes", "on"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LimitsConfig:
     """Holds numeric limits used throughout the pipeline."""
 
@@ -52,9 +86,21 @@ class LimitsConfig:
     worker_pool_size: int = DEFAULT_LIMITS[
         "worker_pool_size"
     ]  # Shared thread pool size for concurrent calls.
+    retry_cache_ttl: int = DEFAULT_LIMITS[
+        "retry_cache_ttl"
+    ]  # Max age in seconds of a reused retry-generation response.
+    generation_cache_ttl: int = DEFAULT_LIMITS[
+        "generation_cache_ttl"
+    ]  # Max age in seconds of a reused generate/filter response.
+    refine_token_budget: int = DEFAULT_LIMITS[
+        "refine_token_budget"
+    ]  # Approximate prompt size at which refinement starts a new chunk.
+    search_batch_size: int = DEFAULT_LIMITS[
+        "search_batch_size"
+    ]  # Searches combined into a single web-search call.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PathsConfig:
     """Collects filesystem locations used by the application."""
 
@@ -63,16 +109,19 @@ class PathsConfig:
     debug_export_dir: Path  # CSV location capturing raw, unfiltered rows.
     reports_dir: Path  # CSV location for user-facing refined reports.
     raw_responses_dir: Path  # Where raw OpenAI API responses are persisted.
+    llm_cache_path: Path  # SQLite file caching planning-step LLM responses.
+    schema_cache_path: Path  # JSON file mapping request descriptions to schemas.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlagsConfig:
     """Boolean feature toggles."""
 
     use_mock_search: bool = False  # Skip live web calls and return mock rows when True.
+    use_llm_cache: bool = True  # Replay cached planning-step LLM responses across runs.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     """Top-level configuration object."""
 
@@ -84,84 +133,127 @@ class Config:
     strategy_map: Mapping[str, Dict[str, str]]
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Instantiates the Config object, honoring environment overrides."""
-    prompts_dir = Path(os.getenv("PROMPTS_DIR", "prompts"))
-    export_dir = Path(os.getenv("EXPORT_DIR", "data"))
-    debug_export_dir = Path(os.getenv("DEBUG_EXPORT_DIR", str(export_dir / "debug")))
-    reports_dir = Path(os.getenv("REPORTS_DIR", "reports"))
-    raw_responses_dir = Path(os.getenv("RAW_RESPONSE_DIR", str(export_dir / "llm")))
-
-    for directory in (
-        prompts_dir,
-        export_dir,
-        debug_export_dir,
-        reports_dir,
-        raw_responses_dir,
-    ):
-        directory.mkdir(parents=True, exist_ok=True)
+    """Instantiates the Config object once, honoring environment overrides."""
+    env = dict(os.environ)
+    prompts_dir = Path(env.get("PROMPTS_DIR", "prompts"))
+    export_dir = Path(env.get("EXPORT_DIR", "data"))
+    debug_export_dir = Path(env.get("DEBUG_EXPORT_DIR", str(export_dir / "debug")))
+    reports_dir = Path(env.get("REPORTS_DIR", "reports"))
+    raw_responses_dir = Path(env.get("RAW_RESPONSE_DIR", str(export_dir / "llm")))
+    llm_cache_path = Path(
+        env.get("LLM_CACHE_PATH", str(export_dir / ".listlm_cache.db"))
+    )
+    schema_cache_path = Path(
+        env.get("SCHEMA_CACHE_PATH", str(export_dir / ".listlm_schema_cache.json"))
+    )
+
+    _ensure_dirs(
+        (
+            prompts_dir,
+            export_dir,
+            debug_export_dir,
+            reports_dir,
+            raw_responses_dir,
+            llm_cache_path.parent,
+            schema_cache_path.parent,
+        )
+    )
 
     models = {
-        "search_gen": os.getenv(
+        "search_gen": env.get(
             "MODEL_SEARCH_GEN", "gpt-5-mini-2025-08-07"
         ),  # Generates bulk search ideas.
-        "search_filter": os.getenv(
+        "search_filter": env.get(
             "MODEL_SEARCH_FILTER", "gpt-5-mini-2025-08-07"
         ),  # Chooses the strongest searches.
-        "schema_gen": os.getenv(
+        "schema_gen": env.get(
             "MODEL_SCHEMA_GEN", "gpt-5-mini-2025-08-07"
         ),  # Designs the CSV schema when needed.
-        "web": os.getenv(
+        "web": env.get(
             "MODEL_WEB", "gpt-5-mini-2025-08-07"
         ),  # Runs web-enabled searches.
-        "postprocess": os.getenv(
+        "postprocess": env.get(
             "MODEL_POSTPROCESS", "gpt-5-mini-2025-08-07"
         ),  # Cleans and dedupes final rows.
     }
 
     limits = LimitsConfig(
         initial_batches=int(
-            os.getenv(
+            env.get(
                 "INITIAL_BATCHES",
                 str(DEFAULT_LIMITS["initial_batches"]),
             )
         ),
         per_batch=int(
-            os.getenv(
+            env.get(
                 "SEARCHES_PER_BATCH",
                 str(DEFAULT_LIMITS["per_batch"]),
             )
         ),
         max_retry_rounds=int(
-            os.getenv(
+            env.get(
                 "MAX_RETRY_ROUNDS",
                 str(DEFAULT_LIMITS["max_retry_rounds"]),
             )
         ),
         worker_pool_size=int(
-            os.getenv(
-                "WORKER_POOL_SIZE",
-                os.getenv(
-                    "SEARCH_EXECUTE_WORKERS",
-                    os.getenv(
+            next(
+                (
+                    env[name]
+                    for name in (
+                        "WORKER_POOL_SIZE",
+                        "SEARCH_EXECUTE_WORKERS",
                         "SEARCH_GENERATE_WORKERS",
-                        str(DEFAULT_LIMITS["worker_pool_size"]),
-                    ),
+                    )
+                    if name in env
                 ),
+                DEFAULT_LIMITS["worker_pool_size"],
+            )
+        ),
+        retry_cache_ttl=int(
+            env.get(
+                "RETRY_CACHE_TTL",
+                str(DEFAULT_LIMITS["retry_cache_ttl"]),
+            )
+        ),
+        generation_cache_ttl=int(
+            env.get(
+                "GENERATION_CACHE_TTL",
+                str(DEFAULT_LIMITS["generation_cache_ttl"]),
+            )
+        ),
+        refine_token_budget=int(
+            env.get(
+                "REFINE_TOKEN_BUDGET",
+                str(DEFAULT_LIMITS["refine_token_budget"]),
+            )
+        ),
+        search_batch_size=int(
+            env.get(
+                "SEARCH_BATCH_SIZE",
+                str(DEFAULT_LIMITS["search_batch_size"]),
             )
         ),
     )
 
     default_columns = tuple(
-        col.strip()
-        for col in os.getenv(
-            "DEFAULT_COLUMNS",
-            "title,url,snippet,source",
-        ).split(",")
-        if col.strip()
+        col
+        for col in (
+            raw.strip()
+            for raw in env.get(
+                "DEFAULT_COLUMNS",
+                "title,url,snippet,source",
+            ).split(",")
+        )
+        if col
     )  # Used when the user does not supply column names.
 
-    flags = FlagsConfig(use_mock_search=_env_bool("USE_MOCK_SEARCH", False))
+    flags = FlagsConfig(
+        use_mock_search=_env_bool(env, "USE_MOCK_SEARCH", False),
+        use_llm_cache=_env_bool(env, "USE_LLM_CACHE", True),
+    )
 
     strategy_map: Dict[str, Dict[str, str]] = {
         "web": {"max_results": "15"},  # Default general-purpose web search.
@@ -185,7 +277,16 @@ def get_config() -> Config:
             debug_export_dir=debug_export_dir,
             reports_dir=reports_dir,
             raw_responses_dir=raw_responses_dir,
+            llm_cache_path=llm_cache_path,
+            schema_cache_path=schema_cache_path,
         ),
         flags=flags,
         strategy_map=strategy_map,
     )
+
+
+def reset_config() -> None:
+    """Clears the cached Config so the next get_config() re-reads the environment."""
+    get_config.cache_clear()
+    # Directories may have been removed since; check them again on next load.
+    _created_dirs.clear()
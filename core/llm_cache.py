@@ -0,0 +1,201 @@
+"""SQLite-backed cache for LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from core.llm_client import LLMClient, LLMResult
+
+
+class CachedLLMClient:
+    """Wraps an LLMClient and replays stored responses for identical requests.
+
+    TTLs and validators are keyed by step name; a step without an exact entry
+    falls back to the part before its first underscore, so ``generate_3``
+    uses the ``generate`` settings. Only responses accepted by the step's
+    validator are stored.
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        db_path: Path,
+        *,
+        ttl_by_step: Optional[Mapping[str, int]] = None,
+        validators: Optional[Mapping[str, Callable[[str], bool]]] = None,
+    ) -> None:
+        self._llm_client = llm_client
+        self._ttl_by_step = dict(ttl_by_step or {})
+        self._validators = dict(validators or {})
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(self.__class__.__name__)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "response_json TEXT NOT NULL, "
+                "created_at INTEGER NOT NULL)"
+            )
+
+    def complete(
+        self,
+        *,
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        step_name: str = "generic",
+        metadata: Optional[Dict[str, Any]] = None,
+        refresh: bool = False,
+    ) -> LLMResult:
+        """Returns a cached response when available, otherwise calls the API.
+
+        ``refresh`` skips the lookup so the call is made again; its result
+        still replaces the stored entry.
+        """
+        key = self._cache_key(model, messages, response_format, tools)
+        cached = None if refresh else self._lookup(key, step_name)
+        if cached is not None:
+            self._logger.debug("LLM cache hit for step %s.", step_name)
+            return cached
+
+        result = self._llm_client.complete(
+            model=model,
+            messages=messages,
+            response_format=response_format,
+            tools=tools,
+            step_name=step_name,
+            metadata=metadata,
+        )
+        self._store_if_valid(key, step_name, result)
+        return result
+
+    def submit(
+        self,
+        *,
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        step_name: str = "generic",
+        metadata: Optional[Dict[str, Any]] = None,
+        refresh: bool = False,
+    ) -> Future[LLMResult]:
+        """Returns a resolved future on a cache hit, otherwise schedules the call."""
+        key = self._cache_key(model, messages, response_format, tools)
+        cached = None if refresh else self._lookup(key, step_name)
+        if cached is not None:
+            self._logger.debug("LLM cache hit for step %s.", step_name)
+            hit: Future[LLMResult] = Future()
+            hit.set_result(cached)
+            return hit
+
+        future = self._llm_client.submit(
+            model=model,
+            messages=messages,
+            response_format=response_format,
+            tools=tools,
+            step_name=step_name,
+            metadata=metadata,
+        )
+        future.add_done_callback(
+            lambda done: self._store_done(key, step_name, done)
+        )
+        return future
+
+    def close(self) -> None:
+        """Closes the cache database; the wrapped client is closed by its owner."""
+        with self._lock:
+            self._conn.close()
+
+    def _lookup(self, key: str, step_name: str) -> Optional[LLMResult]:
+        """Fetches a stored result, ignoring entries older than the step TTL."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_json, created_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        response_json, created_at = row
+        ttl = self._step_setting(self._ttl_by_step, step_name)
+        if ttl is not None and time.time() - created_at > ttl:
+            return None
+        payload = json.loads(response_json)
+        return LLMResult(text=payload["text"], raw=payload["raw"])
+
+    def _store_done(
+        self,
+        key: str,
+        step_name: str,
+        future: Future[LLMResult],
+    ) -> None:
+        """Persists the result of a successfully completed future."""
+        if not future.cancelled() and future.exception() is None:
+            self._store_if_valid(key, step_name, future.result())
+
+    def _store_if_valid(self, key: str, step_name: str, result: LLMResult) -> None:
+        """Stores a result unless the step validator rejects its text."""
+        validator = self._step_setting(self._validators, step_name)
+        if validator is not None:
+            try:
+                accepted = validator(result.text)
+            except Exception:
+                accepted = False
+            if not accepted:
+                self._logger.debug(
+                    "Not caching unusable response for step %s.", step_name
+                )
+                return
+        self._store(key, result)
+
+    def _store(self, key: str, result: LLMResult) -> None:
+        """Persists a result under the given key."""
+        response_json = json.dumps(
+            {"text": result.text, "raw": result.raw},
+            default=str,
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response_json, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, response_json, int(time.time())),
+            )
+
+    @staticmethod
+    def _step_setting(settings: Mapping[str, Any], step_name: str) -> Any:
+        """Looks up a per-step value, falling back to the step-name prefix."""
+        if step_name in settings:
+            return settings[step_name]
+        return settings.get(step_name.split("_", 1)[0])
+
+    @staticmethod
+    def _cache_key(
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Optional[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+    ) -> str:
+        """Hashes a canonical JSON form of the request."""
+        canonical = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "response_format": response_format,
+                "tools": tools,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
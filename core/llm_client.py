@@ -2,21 +2,52 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import itertools
 import json
+import logging
+import operator
 import os
+import queue
+import threading
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 try:
-    from openai import OpenAI
+    import httpx
+    from openai import (
+        AsyncOpenAI,
+        DefaultAsyncHttpxClient,
+        DefaultHttpxClient,
+        OpenAI,
+    )
 except ImportError:  # pragma: no cover - allows import without dependency
+    httpx = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
+    DefaultAsyncHttpxClient = None  # type: ignore
+    DefaultHttpxClient = None  # type: ignore
     OpenAI = None  # type: ignore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None  # type: ignore
+
+_TEXT_CONTENT_TYPES = ("output_text", "text")
+
+# Upper bound on concurrent requests issued through LLMClient.submit().
+DEFAULT_MAX_INFLIGHT = 32
+
+# Keep-alive connections held for blocking complete() calls.
+DEFAULT_POOL_SIZE = 6
 
-@dataclass
+
+@dataclass(slots=True)
 class LLMResult:
     """Container for parsed LLM responses."""
 
@@ -24,16 +55,77 @@ class LLMResult:
     raw: Dict[str, Any]
 
 
+class _RecordWriter:
+    """Single background thread that persists raw LLM records off the call path."""
+
+    def __init__(self, write: Callable[[Dict[str, Any], str], None]) -> None:
+        self._write = write
+        self._queue: queue.Queue[Optional[Tuple[Dict[str, Any], str]]] = queue.Queue()
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._thread = threading.Thread(
+            target=self._drain,
+            name="llm-record-writer",
+            daemon=True,
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, payload: Dict[str, Any], step_name: str) -> None:
+        """Queues a record for writing and returns immediately."""
+        self._queue.put((payload, step_name))
+
+    def close(self) -> None:
+        """Flushes pending records and stops the writer thread."""
+        # Drop the exit hook so closed writers are not kept alive until exit.
+        atexit.unregister(self.close)
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self) -> None:
+        """Writes queued records until the stop sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            payload, step_name = item
+            try:
+                self._write(payload, step_name)
+            except Exception as error:  # pragma: no cover - defensive logging
+                self._logger.error(
+                    "Failed to persist LLM record for step %s: %s", step_name, error
+                )
+
+
 class LLMClient:
     """Thin wrapper around the OpenAI Responses API."""
 
-    def __init__(self, output_dir: Path) -> None:
+    # Serializer per SDK response type, resolved on first sight.
+    _dumper_cache: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+    def __init__(
+        self,
+        output_dir: Path,
+        *,
+        max_inflight: int = DEFAULT_MAX_INFLIGHT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ) -> None:
         self._api_key = os.getenv("OPENAI_API_KEY")
         self._output_dir = output_dir
         self._output_dir.mkdir(parents=True, exist_ok=True)
-        self._client = None
-        if self._api_key and OpenAI is not None:
-            self._client = OpenAI(api_key=self._api_key)
+        self._client_cached: Optional[Any] = None
+        self._client_lock = threading.Lock()
+        self._max_inflight = max(1, max_inflight)
+        self._pool_size = max(1, pool_size)
+        self._record_ids = itertools.count()
+        self._writer = _RecordWriter(self._persist_record)
+        # Async calls run on one event loop owned by this client; the async
+        # SDK client is created and only ever used on that loop's thread.
+        self._async_client_cached: Optional[Any] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._inflight = asyncio.Semaphore(self._max_inflight)
 
     def complete(
         self,
@@ -46,15 +138,80 @@ class LLMClient:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> LLMResult:
         """Executes a call to the OpenAI Responses API."""
+        self._require_api_key()
+        client = self._client
+        kwargs = self._request_kwargs(model, messages, response_format, tools)
+
+        try:
+            response = client.responses.create(**kwargs)
+        except TypeError as error:
+            if not self._drop_response_format(error, kwargs):
+                raise
+            response = client.responses.create(**kwargs)
+        return self._finish(response, model, messages, step_name, metadata)
+
+    async def acomplete(
+        self,
+        *,
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        step_name: str = "generic",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> LLMResult:
+        """Async variant of complete(); must run on this client's event loop."""
+        self._require_api_key()
+        client = self._async_client
+        kwargs = self._request_kwargs(model, messages, response_format, tools)
+
+        async with self._inflight:
+            try:
+                response = await client.responses.create(**kwargs)
+            except TypeError as error:
+                if not self._drop_response_format(error, kwargs):
+                    raise
+                response = await client.responses.create(**kwargs)
+        return self._finish(response, model, messages, step_name, metadata)
+
+    def submit(
+        self,
+        *,
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        step_name: str = "generic",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Future[LLMResult]:
+        """Schedules acomplete() on the event loop without tying up a thread."""
+        return asyncio.run_coroutine_threadsafe(
+            self.acomplete(
+                model=model,
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                step_name=step_name,
+                metadata=metadata,
+            ),
+            self._event_loop,
+        )
+
+    def _require_api_key(self) -> None:
+        """Raises when no API key is configured."""
         if not self._api_key:
             raise EnvironmentError(
                 "OPENAI_API_KEY is not set. Unable to call the OpenAI API."
             )
-        if self._client is None:
-            raise ImportError(
-                "The openai package is required to call the Responses API."
-            )
 
+    @staticmethod
+    def _request_kwargs(
+        model: str,
+        messages: List[Dict[str, Any]],
+        response_format: Optional[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Builds the keyword arguments for responses.create()."""
         kwargs: Dict[str, Any] = {
             "model": model,
             "input": messages,
@@ -63,16 +220,26 @@ class LLMClient:
             kwargs["response_format"] = response_format
         if tools is not None:
             kwargs["tools"] = tools
+        return kwargs
 
-        try:
-            response = self._client.responses.create(**kwargs)
-        except TypeError as error:
-            if "response_format" in str(error) and "response_format" in kwargs:
-                # Some client versions do not yet expose response_format. Retry without it.
-                kwargs.pop("response_format", None)
-                response = self._client.responses.create(**kwargs)
-            else:
-                raise
+    @staticmethod
+    def _drop_response_format(error: TypeError, kwargs: Dict[str, Any]) -> bool:
+        """Removes response_format after a TypeError caused by it."""
+        if "response_format" in str(error) and "response_format" in kwargs:
+            # Some client versions do not yet expose response_format. Retry without it.
+            kwargs.pop("response_format", None)
+            return True
+        return False
+
+    def _finish(
+        self,
+        response: Any,
+        model: str,
+        messages: List[Dict[str, Any]],
+        step_name: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> LLMResult:
+        """Extracts the result and queues the raw record for persistence."""
         raw_dict = self._response_to_dict(response)
         text = self._extract_text(response, raw_dict)
         record = {
@@ -82,27 +249,123 @@ class LLMClient:
             "metadata": metadata or {},
             "response": raw_dict,
         }
-        self._persist_record(record, step_name)
+        self._writer.submit(record, step_name)
         return LLMResult(text=text, raw=raw_dict)
 
+    @property
+    def _client(self) -> Any:
+        """Returns the OpenAI SDK client, creating it on first use."""
+        if self._client_cached is None:
+            with self._client_lock:
+                if self._client_cached is None:
+                    if OpenAI is None:
+                        raise ImportError(
+                            "The openai package is required to call the Responses API."
+                        )
+                    # One pooled HTTP client reuses TLS connections across
+                    # every thread that shares this LLMClient.
+                    self._client_cached = OpenAI(
+                        api_key=self._api_key,
+                        http_client=DefaultHttpxClient(
+                            limits=httpx.Limits(
+                                max_connections=self._pool_size,
+                                max_keepalive_connections=self._pool_size,
+                            )
+                        ),
+                    )
+        return self._client_cached
+
+    @property
+    def _async_client(self) -> Any:
+        """Returns the async SDK client; only called on the event loop thread."""
+        if self._async_client_cached is None:
+            if AsyncOpenAI is None:
+                raise ImportError(
+                    "The openai package is required to call the Responses API."
+                )
+            self._async_client_cached = AsyncOpenAI(
+                api_key=self._api_key,
+                http_client=DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=self._max_inflight,
+                        max_keepalive_connections=self._max_inflight,
+                    )
+                ),
+            )
+        return self._async_client_cached
+
+    @property
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Returns the client's event loop, starting its thread on first use."""
+        if self._loop is None:
+            with self._client_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._loop_thread = threading.Thread(
+                        target=loop.run_forever,
+                        name="llm-event-loop",
+                        daemon=True,
+                    )
+                    self._loop_thread.start()
+                    self._loop = loop
+        return self._loop
+
+    def close(self) -> None:
+        """Closes pooled connections and flushes pending raw records."""
+        loop, self._loop = self._loop, None
+        if loop is not None:
+            if self._async_client_cached is not None:
+                asyncio.run_coroutine_threadsafe(
+                    self._async_client_cached.close(), loop
+                ).result()
+                self._async_client_cached = None
+            loop.call_soon_threadsafe(loop.stop)
+            if self._loop_thread is not None:
+                self._loop_thread.join()
+            loop.close()
+        if self._client_cached is not None:
+            self._client_cached.close()
+            self._client_cached = None
+        self._writer.close()
+
     def _persist_record(self, payload: Dict[str, Any], step_name: str) -> None:
         """Persists raw Responses API payload for debugging."""
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        file_name = f"{timestamp}_{step_name}.json"
+        # The sequence suffix keeps records from the same instant from colliding.
+        file_name = (
+            f"{payload['timestamp']:.6f}_{next(self._record_ids)}_{step_name}.json"
+        )
         file_path = self._output_dir / file_name
-        file_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        if orjson is not None:
+            data = orjson.dumps(
+                payload,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            )
+        else:
+            data = json.dumps(payload, indent=2, default=str).encode("utf-8")
+        file_path.write_bytes(data)
 
-    @staticmethod
-    def _response_to_dict(response: Any) -> Dict[str, Any]:
+    @classmethod
+    def _response_to_dict(cls, response: Any) -> Dict[str, Any]:
         """Converts the SDK response object into a dictionary."""
+        response_type = type(response)
+        dumper = cls._dumper_cache.get(response_type)
+        if dumper is None:
+            dumper = cls._resolve_dumper(response)
+            cls._dumper_cache[response_type] = dumper
+        return dumper(response)
+
+    @staticmethod
+    def _resolve_dumper(response: Any) -> Callable[[Any], Dict[str, Any]]:
+        """Picks the serializer to use for a response type."""
         if hasattr(response, "model_dump"):
-            return response.model_dump()
+            return operator.methodcaller("model_dump")
         if hasattr(response, "to_dict"):
-            return response.to_dict()  # type: ignore[no-any-return]
+            return operator.methodcaller("to_dict")
         if hasattr(response, "dict"):
-            return response.dict()  # type: ignore[no-any-return]
+            return operator.methodcaller("dict")
         if hasattr(response, "json"):
-            return json.loads(response.json())  # type: ignore[arg-type]
+            return lambda value: json.loads(value.json())
         raise TypeError("Unexpected response object type from OpenAI SDK.")
 
     @staticmethod
@@ -112,15 +375,9 @@ class LLMClient:
             return response.output_text  # type: ignore[return-value]
 
         # Fallback to raw dictionary structure.
-        output = raw.get("output", [])
-        if not output:
-            return ""
-        texts: List[str] = []
-        for block in output:
-            content = block.get("content", [])
-            for item in content:
-                if item.get("type") == "output_text":
-                    texts.append(item.get("text", ""))
-                elif item.get("type") == "text":
-                    texts.append(item.get("text", ""))
-        return "\n".join(texts).strip()
+        return "\n".join(
+            item["text"]
+            for block in raw.get("output") or ()
+            for item in block.get("content") or ()
+            if item.get("type") in _TEXT_CONTENT_TYPES and item.get("text")
+        ).strip()
@@ -10,23 +10,28 @@ class ModelRegistry:
 
     def __init__(self, models: Mapping[str, str]) -> None:
         self._models = dict(models)
+        self._search_gen = self._models["search_gen"]
+        self._search_filter = self._models["search_filter"]
+        self._schema_gen = self._models["schema_gen"]
+        self._web = self._models["web"]
+        self._postprocess = self._models["postprocess"]
 
     def for_generate_searches(self) -> str:
         """Returns the model for search generation."""
-        return self._models["search_gen"]
+        return self._search_gen
 
     def for_filter_searches(self) -> str:
         """Returns the model for filtering searches."""
-        return self._models["search_filter"]
+        return self._search_filter
 
     def for_schema(self) -> str:
         """Returns the model for schema generation."""
-        return self._models["schema_gen"]
+        return self._schema_gen
 
     def for_web(self) -> str:
         """Returns the model for web search execution."""
-        return self._models["web"]
+        return self._web
 
     def for_postprocess(self) -> str:
         """Returns the model for post-processing results."""
-        return self._models["postprocess"]
+        return self._postprocess
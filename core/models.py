@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class UserRequest:
     """Captures the user's initial configuration."""
 
@@ -16,7 +16,7 @@ class UserRequest:
     dedupe_field: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchTask:
     """Represents a single search to execute."""
 
@@ -26,39 +26,46 @@ class SearchTask:
     rationale: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class SearchPlan:
-    """Collection of search tasks."""
+    """Collection of search tasks keyed by ID in insertion order."""
 
-    tasks: List[SearchTask] = field(default_factory=list)
+    _by_id: Dict[str, SearchTask]
+
+    def __init__(self, tasks: Optional[Iterable[SearchTask]] = None) -> None:
+        self._by_id = {}
+        for task in tasks or ():
+            self._by_id[task.id] = task
+
+    @property
+    def tasks(self) -> List[SearchTask]:
+        """Returns the tasks in insertion order."""
+        return list(self._by_id.values())
+
+    def __len__(self) -> int:
+        """Returns the number of tasks without copying them."""
+        return len(self._by_id)
 
     def add_task(self, task: SearchTask) -> None:
         """Appends a task to the plan, replacing any existing ID."""
-        existing_index = next(
-            (index for index, current in enumerate(self.tasks) if current.id == task.id),
-            -1,
-        )
-        if existing_index == -1:
-            self.tasks.append(task)
-        else:
-            self.tasks[existing_index] = task
+        self._by_id[task.id] = task
 
     def ids(self) -> List[str]:
         """Returns the list of task identifiers."""
-        return [task.id for task in self.tasks]
+        return list(self._by_id)
 
     def filter_by_ids(self, keep_ids: Iterable[str]) -> "SearchPlan":
         """Creates a new plan containing only tasks whose IDs are in keep_ids."""
-        keep = set(keep_ids)
-        return SearchPlan(tasks=[task for task in self.tasks if task.id in keep])
+        by_id = self._by_id
+        return SearchPlan(tasks=[by_id[key] for key in keep_ids if key in by_id])
 
     def remove_ids(self, drop_ids: Iterable[str]) -> None:
         """Removes tasks from the plan whose IDs are listed."""
-        drop = set(drop_ids)
-        self.tasks = [task for task in self.tasks if task.id not in drop]
+        for key in drop_ids:
+            self._by_id.pop(key, None)
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedRow:
     """Represents a normalized row ready for export."""
 
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-import json
 import re
-from typing import Iterable, List
+from typing import Dict, Iterable, List
 
 from core.models import SearchTask
 
+try:
+    from orjson import JSONDecodeError, loads as _json_loads
+except ImportError:  # pragma: no cover - falls back to the stdlib decoder
+    from json import JSONDecodeError, loads as _json_loads
+
+_ID_RE = re.compile(r"\b([A-Za-z0-9_\-]+)\b")
+
 
 def parse_search_tasks(
     raw_text: str,
@@ -16,64 +22,96 @@ def parse_search_tasks(
     default_strategy: str = "web",
 ) -> List[SearchTask]:
     """Parses search tasks from a Responses API text payload."""
-    tasks: List[SearchTask] = []
     try:
-        payload = json.loads(raw_text)
-        if isinstance(payload, dict):
-            payload = payload.get("searches") or payload.get("tasks") or []
-        if not isinstance(payload, list):
-            raise ValueError("Expected list payload for search tasks.")
-        seen_ids: Dict[str, int] = {}
-        for idx, item in enumerate(payload):
-            if not isinstance(item, dict):
-                continue
-            base_id = str(item.get("id") or f"{batch_index}_{idx}")
-            suffix = seen_ids.get(base_id, 0)
-            task_id = base_id if suffix == 0 else f"{base_id}_{suffix}"
-            seen_ids[base_id] = suffix + 1
-            query = str(item.get("query", "")).strip()
-            strategy = str(item.get("strategy") or default_strategy).strip()
-            rationale = item.get("rationale")
-            if not query:
-                continue
-            tasks.append(
-                SearchTask(
-                    id=task_id,
-                    query=query,
-                    strategy=strategy or default_strategy,
-                    rationale=str(rationale).strip() if rationale else None,
-                )
+        payload = _json_loads(raw_text)
+    except JSONDecodeError:
+        return _fallback_parse_lines(raw_text, batch_index, default_strategy)
+    if isinstance(payload, dict):
+        payload = payload.get("searches") or payload.get("tasks") or []
+    if not isinstance(payload, list):
+        raise ValueError("Expected list payload for search tasks.")
+    return _tasks_from_items(payload, batch_index, str(default_strategy))
+
+
+def parse_multi_batch_search_tasks(
+    raw_text: str,
+    *,
+    default_strategy: str = "web",
+) -> List[List[SearchTask]]:
+    """Parses a multi-batch generation response into one task list per batch.
+
+    A flat ``searches`` payload is accepted as a single batch.
+    """
+    try:
+        payload = _json_loads(raw_text)
+    except JSONDecodeError:
+        return [_fallback_parse_lines(raw_text, 0, default_strategy)]
+    default_strategy = str(default_strategy)
+    batches = payload.get("batches") if isinstance(payload, dict) else payload
+    if not isinstance(batches, list):
+        return [parse_search_tasks(raw_text, default_strategy=default_strategy)]
+    parsed: List[List[SearchTask]] = []
+    for batch_index, batch in enumerate(batches):
+        if isinstance(batch, dict):
+            batch = batch.get("searches") or batch.get("tasks") or []
+        if isinstance(batch, list):
+            parsed.append(_tasks_from_items(batch, batch_index, default_strategy))
+    return parsed
+
+
+def _tasks_from_items(
+    items: List[object],
+    batch_index: int,
+    default_strategy: str,
+) -> List[SearchTask]:
+    """Builds SearchTasks from decoded items, suffixing repeated IDs."""
+    tasks: List[SearchTask] = []
+    seen_ids: Dict[str, int] = {}
+    for idx, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        query = str(item.get("query", "")).strip()
+        if not query:
+            continue
+        raw_id = item.get("id")
+        base_id = str(raw_id) if raw_id else f"{batch_index}_{idx}"
+        count = seen_ids.get(base_id, 0)
+        seen_ids[base_id] = count + 1
+        strategy = str(item.get("strategy") or "").strip() or default_strategy
+        rationale = item.get("rationale")
+        tasks.append(
+            SearchTask(
+                id=base_id if count == 0 else f"{base_id}_{count}",
+                query=query,
+                strategy=strategy,
+                rationale=str(rationale).strip() if rationale else None,
             )
-    except json.JSONDecodeError:
-        tasks = _fallback_parse_lines(raw_text, batch_index, default_strategy)
+        )
     return tasks
 
 
 def parse_filter_ids(raw_text: str) -> List[str]:
     """Parses an ordered list of IDs from a filter response."""
     try:
-        payload = json.loads(raw_text)
+        payload = _json_loads(raw_text)
         if isinstance(payload, dict):
             payload = payload.get("ids") or payload.get("keep") or []
         if isinstance(payload, list):
             return [str(item).strip() for item in payload if str(item).strip()]
-    except json.JSONDecodeError:
+    except JSONDecodeError:
         pass
-    return [
-        match.group(1)
-        for match in re.finditer(r"\b([A-Za-z0-9_\-]+)\b", raw_text)
-    ]
+    return _ID_RE.findall(raw_text)
 
 
 def parse_schema(raw_text: str) -> List[str]:
     """Parses schema column names."""
     try:
-        payload = json.loads(raw_text)
+        payload = _json_loads(raw_text)
         if isinstance(payload, dict):
             payload = payload.get("columns") or payload.get("fields") or []
         if isinstance(payload, list):
             return [str(item).strip() for item in payload if str(item).strip()]
-    except json.JSONDecodeError:
+    except JSONDecodeError:
         pass
     return [segment.strip() for segment in raw_text.split(",") if segment.strip()]
 
@@ -81,8 +119,8 @@ def parse_schema(raw_text: str) -> List[str]:
 def parse_refined_companies(raw_text: str) -> List[dict]:
     """Parses refined company dictionaries returned by the post-processor."""
     try:
-        payload = json.loads(raw_text)
-    except json.JSONDecodeError:
+        payload = _json_loads(raw_text)
+    except JSONDecodeError:
         return []
 
     candidates = None
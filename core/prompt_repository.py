@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
+
+# Separates a template's static instructions from its per-call input block.
+SECTION_MARKER = "\n--- input ---\n"
 
 
 class PromptRepository:
@@ -12,15 +16,49 @@ class PromptRepository:
     def __init__(self, base_dir: Path) -> None:
         self._base_dir = base_dir
         self._cache: Dict[str, str] = {}
+        self._sections: Dict[str, Tuple[str, str]] = {}
+        self._preload()
 
     def load(self, name: str) -> str:
         """Returns the prompt text for the given name, caching the result."""
-        if name in self._cache:
+        try:
             return self._cache[name]
-        file_path = self._base_dir / f"{name}.txt"
-        if not file_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {file_path}")
-        prompt_text = file_path.read_text(encoding="utf-8")
-        self._cache[name] = prompt_text
-        return prompt_text
+        except KeyError:
+            prompt_text = self._read(name)
+            self._cache[name] = prompt_text
+            return prompt_text
+
+    def load_sections(self, name: str) -> Tuple[str, str]:
+        """Returns the (static instructions, per-call input) halves of a prompt.
 
+        Templates without a section marker are treated as all per-call input.
+        """
+        sections = self._sections.get(name)
+        if sections is None:
+            prompt_text = self.load(name)
+            prefix, marker, suffix = prompt_text.partition(SECTION_MARKER)
+            sections = (prefix, suffix) if marker else ("", prompt_text)
+            self._sections[name] = sections
+        return sections
+
+    def _preload(self) -> None:
+        """Reads every *.txt template with a single directory scan."""
+        try:
+            entries = os.scandir(self._base_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(".txt") and entry.is_file():
+                    self._cache[entry.name[:-4]] = (
+                        Path(entry.path).read_bytes().decode("utf-8")
+                    )
+
+    def _read(self, name: str) -> str:
+        """Reads a prompt file from disk without a separate existence check."""
+        file_path = self._base_dir / f"{name}.txt"
+        try:
+            data = file_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt file not found: {file_path}") from None
+        return data.decode("utf-8")
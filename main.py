@@ -36,7 +36,11 @@ def main() -> None:
     config = get_config()
 
     prompt_repo = PromptRepository(config.paths.prompts_dir)
-    llm_client = LLMClient(config.paths.raw_responses_dir)
+    # A single client (and HTTP connection pool) is shared by every component.
+    llm_client = LLMClient(
+        config.paths.raw_responses_dir,
+        pool_size=config.limits.worker_pool_size,
+    )
     model_registry = ModelRegistry(config.models)
     database = InMemoryDatabase()
     debug_exporter = CSVExporter(config.paths.debug_export_dir)
@@ -69,7 +73,11 @@ def main() -> None:
         refiner=refiner,
         io=io,
     )
-    orchestrator.run()
+    try:
+        with orchestrator:
+            orchestrator.run()
+    finally:
+        llm_client.close()
     logger.info("Workflow completed.")
 
 
@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import statistics
+import time
 from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from config import Config
-from core.llm_client import LLMClient
+from core.llm_cache import CachedLLMClient
+from core.llm_client import LLMClient, LLMResult
 from core.model_registry import ModelRegistry
-from core.models import NormalizedRow, SearchPlan, SearchTask, UserRequest
-from core.parser import parse_filter_ids, parse_schema, parse_search_tasks
+from core.models import SearchPlan, SearchTask, UserRequest
+from core.parser import (
+    parse_filter_ids,
+    parse_multi_batch_search_tasks,
+    parse_schema,
+    parse_search_tasks,
+)
 from core.prompt_repository import PromptRepository
 from pipeline.user_io import TerminalIO
 from postprocess.refiner import ResultRefiner
@@ -23,11 +39,35 @@ from storage.database import InMemoryDatabase
 from storage.exporter import CSVExporter
 
 
+# Raw rows shrink during refinement, so stop early only well past the target.
+EARLY_STOP_FACTOR = 2
+
+# Largest total search count requested from a single multi-batch generation
+# call; bigger requests fan out one call per batch to stay within context.
+MULTI_BATCH_MAX_SEARCHES = 100
+
+# Below this many per-batch calls, each batch is split into two half-size
+# calls so a single slow response holds back a smaller share of the results.
+MICRO_BATCH_THRESHOLD = 8
+
+# Provenance columns appended to every schema and hidden from the report.
+METADATA_COLUMNS = ("source_query_id", "source_strategy")
+
+
+def _has_search_tasks(text: str) -> bool:
+    """Returns True when a generation response yields at least one task."""
+    return bool(parse_search_tasks(text))
+
+
+def _has_multi_batch_tasks(text: str) -> bool:
+    """Returns True when any batch of a multi-batch response has tasks."""
+    return any(parse_multi_batch_search_tasks(text))
+
+
 @dataclass
 class ExecutionResult:
     """Represents the outcome of executing a search plan."""
 
-    rows: List[NormalizedRow]
     summaries: List[SearchSummary]
 
 
@@ -49,7 +89,28 @@ class PipelineOrchestrator:
     ) -> None:
         self._config = config
         self._prompts = prompt_repository
-        self._llm_client = llm_client
+        self._llm_client: LLMClient | CachedLLMClient = llm_client
+        self._llm_cache: Optional[CachedLLMClient] = None
+        if config.flags.use_llm_cache:
+            # Planning steps repeat verbatim across runs; replay them from disk.
+            # Sampled steps expire so repeated runs still see new candidates.
+            self._llm_cache = CachedLLMClient(
+                llm_client,
+                config.paths.llm_cache_path,
+                ttl_by_step={
+                    "generate": config.limits.generation_cache_ttl,
+                    "filter": config.limits.generation_cache_ttl,
+                    "retry": config.limits.retry_cache_ttl,
+                },
+                validators={
+                    "generate_multi": _has_multi_batch_tasks,
+                    "generate": _has_search_tasks,
+                    "retry": _has_search_tasks,
+                    "filter": lambda text: bool(parse_filter_ids(text)),
+                    "schema": lambda text: bool(parse_schema(text)),
+                },
+            )
+            self._llm_client = self._llm_cache
         self._models = model_registry
         self._search_executor = search_executor
         self._db = db
@@ -61,18 +122,72 @@ class PipelineOrchestrator:
         self._filter_feedback_history: List[str] = []
         self._user_task_counter = 0
         self._task_counter = 0
+        # Refined output for the first _refined_row_count database rows.
+        self._refined_records: List[Dict[str, Any]] = []
+        self._refined_row_count = 0
+        self._refined_schema: Tuple[str, ...] = ()
         self._logger = logging.getLogger(self.__class__.__name__)
+        # One pool serves generation, planning and execution across all rounds.
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, config.limits.worker_pool_size),
+            thread_name_prefix="orchestrator",
+        )
+        self._templates = {
+            name: self._compile_template(name, system_prompt)
+            for name, system_prompt in (
+                ("generate_searches", "You generate diverse web searches."),
+                ("generate_searches_multi", "You generate diverse web searches."),
+                ("filter_primary", "You select the most promising searches."),
+                ("filter_trim", "You select the most promising searches."),
+                (
+                    "retry_searches",
+                    "You refine web searches based on performance data.",
+                ),
+            )
+        }
+        # A split batch asks for a ceil half and a floor half, so each pair
+        # of micro-batches still requests exactly per_batch searches.
+        floor_half = config.limits.per_batch // 2
+        self._micro_batch_sizes = (config.limits.per_batch - floor_half, floor_half)
+        self._micro_templates = {
+            size: self._compile_template(
+                "generate_searches",
+                "You generate diverse web searches.",
+                per_batch=size,
+            )
+            for size in dict.fromkeys(self._micro_batch_sizes)
+            if size
+        }
+
+    def __enter__(self) -> "PipelineOrchestrator":
+        """Returns the orchestrator for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Releases pooled resources on context exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the worker pool and the response cache owned by this instance."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        if self._llm_cache is not None:
+            self._llm_cache.close()
 
     def run(self) -> None:
         """Runs the orchestration loop end-to-end."""
         request = self._io.collect_user_request()
         self._io.display_status("Generating initial search candidates...")
         candidate_tasks = self._generate_initial_searches(request)
-        schema = self._resolve_schema(request, candidate_tasks)
+        schema, next_plan = self._prepare_schema_and_plan(request, candidate_tasks)
 
         retry_round = 0
         while True:
-            plan = self._select_plan(candidate_tasks, request)
+            plan = (
+                next_plan
+                if next_plan is not None
+                else self._select_plan(candidate_tasks, request)
+            )
+            next_plan = None
             while True:
                 review = self._io.review_search_plan(plan)
                 feedback = review.get("feedback")
@@ -83,7 +198,9 @@ class PipelineOrchestrator:
                     self._io.display_status(
                         "Regenerating search plan with new feedback..."
                     )
-                    candidate_tasks = self._generate_initial_searches(request)
+                    candidate_tasks = self._generate_initial_searches(
+                        request, fresh=True
+                    )
                     break
 
                 candidate_tasks, new_tasks = self._apply_candidate_changes(
@@ -94,7 +211,7 @@ class PipelineOrchestrator:
                     filter_feedback = review.get("filter_feedback")
                     if filter_feedback:
                         self._filter_feedback_history.append(str(filter_feedback))
-                    plan = self._select_plan(candidate_tasks, request)
+                    plan = self._select_plan(candidate_tasks, request, fresh=True)
                     continue
 
                 plan = self._apply_review(plan, review, new_tasks)
@@ -103,9 +220,8 @@ class PipelineOrchestrator:
             if review.get("regenerate"):
                 continue
 
-            execution = self._execute_plan(plan, schema)
             prev_total = self._db.count()
-            self._db.extend(execution.rows)
+            execution = self._execute_plan(plan, schema, request)
             total_items = self._db.count()
             self._io.display_status(
                 f"Collected {total_items} items (target: {request.min_items})."
@@ -121,7 +237,7 @@ class PipelineOrchestrator:
             needs_retry = total_items < request.min_items
 
             if not needs_retry:
-                refined_preview = self._refiner.refine(self._db.rows(), request, schema)
+                refined_preview = self._refine_collected(request, schema)
                 refined_count = len(refined_preview)
                 self._logger.info(
                     "Refined output currently has %d items.",
@@ -163,88 +279,253 @@ class PipelineOrchestrator:
                 total_items=total_items,
             )
 
-    def _generate_initial_searches(self, request: UserRequest) -> List[SearchTask]:
-        """Generates the initial set of candidate searches."""
-        prompt_template = self._prompts.load("generate_searches")
+    def _prepare_schema_and_plan(
+        self,
+        request: UserRequest,
+        candidate_tasks: List[SearchTask],
+    ) -> Tuple[List[str], SearchPlan]:
+        """Resolves the schema and first plan, overlapping their LLM calls."""
+        if request.columns:
+            # No schema call is needed, so there is nothing to overlap.
+            return (
+                self._resolve_schema(request, candidate_tasks),
+                self._select_plan(candidate_tasks, request),
+            )
+        schema_future = self._pool.submit(
+            self._resolve_schema, request, candidate_tasks
+        )
+        plan_future = self._pool.submit(self._select_plan, candidate_tasks, request)
+        return schema_future.result(), plan_future.result()
+
+    def _generate_initial_searches(
+        self,
+        request: UserRequest,
+        *,
+        fresh: bool = False,
+    ) -> List[SearchTask]:
+        """Generates the initial set of candidate searches.
+
+        ``fresh`` bypasses cached responses, as for a user-requested
+        regeneration.
+        """
         total_batches = self._config.limits.initial_batches
-        max_workers = max(1, self._config.limits.worker_pool_size)
+        if (
+            total_batches > 1
+            and total_batches * self._config.limits.per_batch
+            <= MULTI_BATCH_MAX_SEARCHES
+        ):
+            tasks = self._generate_multi_batch(request, total_batches, fresh=fresh)
+            if tasks:
+                return tasks
+        return self._generate_batches_concurrently(
+            request, total_batches, fresh=fresh
+        )
+
+    def _generate_multi_batch(
+        self,
+        request: UserRequest,
+        total_batches: int,
+        *,
+        fresh: bool = False,
+    ) -> List[SearchTask]:
+        """Requests every initial batch in one call; returns [] on failure."""
+        try:
+            response = self._llm_client.complete(
+                model=self._models.for_generate_searches(),
+                messages=self._build_messages(
+                    self._templates["generate_searches_multi"],
+                    description=request.description,
+                    total_batches=total_batches,
+                    feedback="\n".join(self._feedback_history) or "None",
+                ),
+                response_format={"type": "json_object"},
+                step_name="generate_multi",
+                metadata={"total_batches": total_batches},
+                **self._cache_options(fresh),
+            )
+            batches = parse_multi_batch_search_tasks(
+                response.text,
+                default_strategy="web",
+            )
+        except Exception as error:  # pragma: no cover - defensive
+            self._logger.error(
+                "Multi-batch generation failed: %s. Falling back to per-batch calls.",
+                error,
+            )
+            return []
+        all_tasks: List[SearchTask] = []
+        for batch_index, tasks in enumerate(batches):
+            self._assign_task_ids(tasks)
+            all_tasks.extend(tasks)
+            self._logger.info(
+                "Generated %d tasks in batch %d.",
+                len(tasks),
+                batch_index + 1,
+            )
+        if not all_tasks:
+            self._logger.warning(
+                "Multi-batch generation returned no tasks. "
+                "Falling back to per-batch calls."
+            )
+            return []
+        all_tasks = self._dedupe_tasks(all_tasks)
+        self._logger.info("Total candidate tasks: %d", len(all_tasks))
+        return all_tasks
+
+    def _generate_batches_concurrently(
+        self,
+        request: UserRequest,
+        total_batches: int,
+        *,
+        fresh: bool = False,
+    ) -> List[SearchTask]:
+        """Issues one generation call per batch and gathers the results."""
+        template = self._templates["generate_searches"]
+        per_batch = self._config.limits.per_batch
+        split = total_batches < MICRO_BATCH_THRESHOLD and per_batch > 1
+        if split:
+            total_batches *= 2
         futures = {}
+        started: Dict[int, float] = {}
+        latencies: List[float] = []
         all_tasks: List[SearchTask] = []
 
-        def submit_batch(executor: ThreadPoolExecutor, batch_index: int) -> None:
-            future = executor.submit(
-                self._generate_search_batch,
+        def submit_batch(batch_index: int) -> None:
+            started[batch_index] = time.perf_counter()
+            if split:
+                batch_size = self._micro_batch_sizes[batch_index % 2]
+                batch_template = self._micro_templates[batch_size]
+            else:
+                batch_size = per_batch
+                batch_template = template
+            future = self._submit_search_batch(
                 request,
-                prompt_template,
+                batch_template,
                 batch_index,
                 total_batches,
+                batch_size,
+                fresh=fresh,
             )
             futures[future] = batch_index
 
-        with ThreadPoolExecutor(
-            max_workers=min(max_workers, max(1, total_batches))
-        ) as executor:
-            for batch_index in range(total_batches):
-                submit_batch(executor, batch_index)
+        for batch_index in range(total_batches):
+            submit_batch(batch_index)
 
-            for future in as_completed(futures):
-                batch_index = futures[future]
+        # Failed batches are resubmitted once so the retry overlaps with
+        # the batches still in flight instead of blocking the loop.
+        retried: set[int] = set()
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch_index = futures.pop(future)
                 try:
-                    tasks = future.result()
+                    response = future.result()
                 except Exception as error:  # pragma: no cover - defensive
+                    if batch_index in retried:
+                        raise
+                    retried.add(batch_index)
                     self._logger.error(
-                        "Batch %d generation failed: %s. Retrying sequentially.",
+                        "Batch %d generation failed: %s. Retrying.",
                         batch_index + 1,
                         error,
                     )
-                    tasks = self._generate_search_batch(
-                        request,
-                        prompt_template,
-                        batch_index,
-                        total_batches,
+                    submit_batch(batch_index)
+                    continue
+                latencies.append(time.perf_counter() - started[batch_index])
+                tasks = parse_search_tasks(
+                    response.text,
+                    batch_index=batch_index,
+                    default_strategy="web",
                 )
+                self._assign_task_ids(tasks)
                 all_tasks.extend(tasks)
                 self._logger.info(
                     "Generated %d tasks in batch %d.",
                     len(tasks),
                     batch_index + 1,
                 )
+        if latencies:
+            self._logger.info(
+                "Batch latency over %d calls: min %.2fs, median %.2fs, max %.2fs.",
+                len(latencies),
+                min(latencies),
+                statistics.median(latencies),
+                max(latencies),
+            )
+        all_tasks = self._dedupe_tasks(all_tasks)
         self._logger.info("Total candidate tasks: %d", len(all_tasks))
         return all_tasks
 
-    def _generate_search_batch(
+    def _submit_search_batch(
         self,
         request: UserRequest,
-        prompt_template: str,
+        template: Tuple[str, str],
         batch_index: int,
         total_batches: int,
-    ) -> List[SearchTask]:
-        """Runs a single batch generation request."""
-        prompt = prompt_template.format(
+        per_batch: int,
+        *,
+        fresh: bool = False,
+    ) -> Future[LLMResult]:
+        """Schedules a single batch generation request on the async client."""
+        messages = self._build_messages(
+            template,
             description=request.description,
             batch_number=batch_index + 1,
             total_batches=total_batches,
-            per_batch=self._config.limits.per_batch,
+            per_batch=per_batch,
             feedback="\n".join(self._feedback_history) or "None",
         )
-        messages = [
-            {"role": "system", "content": "You generate diverse web searches."},
-            {"role": "user", "content": prompt},
-        ]
-        response = self._llm_client.complete(
+        return self._llm_client.submit(
             model=self._models.for_generate_searches(),
             messages=messages,
             response_format={"type": "json_object"},
             step_name=f"generate_{batch_index}",
             metadata={"batch_index": batch_index},
+            **self._cache_options(fresh),
         )
-        tasks = parse_search_tasks(
-            response.text,
-            batch_index=batch_index,
-            default_strategy="web",
-        )
-        self._assign_task_ids(tasks)
-        return tasks
+
+    def _cache_options(self, fresh: bool) -> Dict[str, Any]:
+        """Returns the cache keyword arguments for a planning call."""
+        if fresh and self._llm_cache is not None:
+            return {"refresh": True}
+        return {}
+
+    def _compile_template(
+        self,
+        name: str,
+        system_prompt: str,
+        *,
+        per_batch: Optional[int] = None,
+    ) -> Tuple[str, str]:
+        """Returns (system content, input template) for a sectioned prompt.
+
+        The static half may only reference run-wide constants, so it is
+        formatted once here and stays byte-identical across calls.
+        """
+        prefix, suffix = self._prompts.load_sections(name)
+        system_content = system_prompt
+        if prefix:
+            static_prefix = prefix.format(
+                per_batch=per_batch or self._config.limits.per_batch
+            )
+            system_content = f"{system_prompt}\n\n{static_prefix}"
+        return system_content, suffix
+
+    @staticmethod
+    def _build_messages(
+        template: Tuple[str, str],
+        **values: Any,
+    ) -> List[Dict[str, str]]:
+        """Puts static instructions in the system message and inputs last.
+
+        Keeping every per-call value out of the leading tokens lets the
+        provider reuse its cached prefix across batches and retries.
+        """
+        system_content, suffix = template
+        return [
+            {"role": "system", "content": system_content},
+            {"role": "user", "content": suffix.format(**values)},
+        ]
 
     def _resolve_schema(
         self,
@@ -255,51 +536,121 @@ class PipelineOrchestrator:
         if request.columns:
             schema = list(request.columns)
         else:
-            prompt_template = self._prompts.load("build_schema")
-            prompt = prompt_template.format(
-                description=request.description,
-                example_queries="\n".join(task.query for task in candidate_tasks[:5]),
-            )
-            response = self._llm_client.complete(
-                model=self._models.for_schema(),
-                messages=[
-                    {"role": "system", "content": "You design CSV schemas."},
-                    {"role": "user", "content": prompt},
-                ],
-                response_format={"type": "json_object"},
-                step_name="schema",
-            )
-            schema = parse_schema(response.text)
+            schema = self._load_cached_schema(request.description)
+            if schema is None:
+                schema = self._generate_schema(request, candidate_tasks)
+            else:
+                self._logger.info("Reusing cached schema for this description.")
 
         # Ensure metadata columns are always present at the end.
-        for column in ("source_query_id", "source_strategy"):
-            if column not in schema:
-                schema.append(column)
+        present = set(schema)
+        schema.extend(column for column in METADATA_COLUMNS if column not in present)
         self._logger.info("Resolved schema columns: %s", schema)
         return schema
 
+    def _generate_schema(
+        self,
+        request: UserRequest,
+        candidate_tasks: List[SearchTask],
+    ) -> List[str]:
+        """Asks the schema model for columns and caches them by description."""
+        prompt_template = self._prompts.load("build_schema")
+        prompt = prompt_template.format(
+            description=request.description,
+            example_queries="\n".join(task.query for task in candidate_tasks[:5]),
+        )
+        response = self._llm_client.complete(
+            model=self._models.for_schema(),
+            messages=[
+                {"role": "system", "content": "You design CSV schemas."},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+            step_name="schema",
+        )
+        schema = parse_schema(response.text)
+        if schema and self._config.flags.use_llm_cache:
+            self._store_cached_schema(request.description, schema)
+        return schema
+
+    @staticmethod
+    def _schema_cache_key(description: str) -> str:
+        """Hashes the request description into a schema cache key."""
+        return hashlib.sha256(description.strip().encode("utf-8")).hexdigest()
+
+    def _read_schema_cache(self) -> Dict[str, List[str]]:
+        """Loads the on-disk schema cache, treating a bad file as empty."""
+        try:
+            with self._config.paths.schema_cache_path.open(encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _load_cached_schema(self, description: str) -> Optional[List[str]]:
+        """Returns a previously generated schema for the description, if any."""
+        if not self._config.flags.use_llm_cache:
+            return None
+        cached = self._read_schema_cache().get(self._schema_cache_key(description))
+        if isinstance(cached, list) and cached:
+            return [str(column) for column in cached]
+        return None
+
+    def _store_cached_schema(self, description: str, schema: List[str]) -> None:
+        """Records a generated schema, replacing the cache file atomically."""
+        cache_path = self._config.paths.schema_cache_path
+        payload = self._read_schema_cache()
+        payload[self._schema_cache_key(description)] = list(schema)
+        temp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(temp_path, cache_path)
+        except OSError as error:  # pragma: no cover - cache is best effort
+            self._logger.warning("Could not write schema cache: %s", error)
+
     def _select_plan(
         self,
         candidate_tasks: List[SearchTask],
         request: UserRequest,
+        *,
+        fresh: bool = False,
     ) -> SearchPlan:
-        """Filters candidates to build the initial plan."""
-        primary_template = self._prompts.load("filter_primary")
-        trim_template = self._prompts.load("filter_trim")
+        """Filters candidates to build the initial plan.
+
+        ``fresh`` bypasses cached filter responses, as for a user-requested
+        refilter.
+        """
+        candidate_tasks = self._dedupe_tasks(candidate_tasks)
+        primary_template = self._templates["filter_primary"]
+        trim_template = self._templates["filter_trim"]
         target_filtered = max(
             1,
             min(request.min_items // 4 or 1, len(candidate_tasks)),
         )
+        if (
+            len(candidate_tasks) <= target_filtered
+            and not self._filter_feedback_history
+        ):
+            # Nothing to cut and no user guidance to apply; skip the LLM call.
+            self._logger.info(
+                "Keeping all %d candidate tasks without filtering.",
+                len(candidate_tasks),
+            )
+            return SearchPlan(tasks=candidate_tasks)
         filter_feedback = "\n".join(self._filter_feedback_history) or "None"
         initial_plan = self._execute_filter_prompt(
             primary_template,
             candidate_tasks,
             target_filtered,
             filter_feedback,
+            fresh=fresh,
         )
 
         filtered_tasks = initial_plan.tasks
-        if len(filtered_tasks) > target_filtered:
+        # The primary pass returns a ranked list, so a small overshoot is cut
+        # locally; only a large one is worth a second LLM call.
+        if len(filtered_tasks) > 2 * target_filtered:
             remove_count = len(filtered_tasks) - target_filtered
             self._logger.info(
                 "Filter kept %d searches (target %d). Running trim pass to remove %d.",
@@ -311,10 +662,18 @@ class PipelineOrchestrator:
                 trim_template,
                 filtered_tasks,
                 target_filtered,
-            filter_feedback,
-            current_count=len(filtered_tasks),
-        )
+                filter_feedback,
+                current_count=len(filtered_tasks),
+                fresh=fresh,
+            )
             filtered_tasks = trimmed_plan.tasks
+        if len(filtered_tasks) > target_filtered:
+            self._logger.warning(
+                "Filter returned %d tasks (target %d). Trimming locally.",
+                len(filtered_tasks),
+                target_filtered,
+            )
+            filtered_tasks = filtered_tasks[:target_filtered]
 
         self._logger.info(
             "Filter kept %d of %d candidate tasks.",
@@ -325,28 +684,33 @@ class PipelineOrchestrator:
 
     def _execute_filter_prompt(
         self,
-        prompt_template: str,
+        template: Tuple[str, str],
         candidate_tasks: List[SearchTask],
         target_filtered: int,
         filter_feedback: str,
         *,
         current_count: Optional[int] = None,
+        fresh: bool = False,
     ) -> SearchPlan:
-        serialized_tasks = [
-            {
-                "id": task.id,
-                "query": task.query,
-                "strategy": task.strategy,
-                "rationale": task.rationale or "",
-            }
-            for task in candidate_tasks
-        ]
+        # Sorted by ID so identical candidate sets serialize byte-for-byte.
+        # Only the ID, query and a non-default strategy inform the choice, so
+        # rationales and whitespace are left out to keep the prompt small.
+        serialized_tasks = []
+        for task in sorted(candidate_tasks, key=lambda task: task.id):
+            entry = {"id": task.id, "q": task.query}
+            if task.strategy != "web":
+                entry["s"] = task.strategy
+            serialized_tasks.append(entry)
         prompt_kwargs = {
             "filtered_count": target_filtered,
             "filter_feedback": filter_feedback,
-            "tasks": json.dumps(serialized_tasks, indent=2),
+            "tasks": json.dumps(
+                serialized_tasks,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ),
         }
-        if "{current_count}" in prompt_template:
+        if "{current_count}" in template[1]:
             actual_current = current_count or len(candidate_tasks)
             remove_count = max(0, actual_current - target_filtered)
             prompt_kwargs.update(
@@ -355,32 +719,27 @@ class PipelineOrchestrator:
                     "remove_count": remove_count,
                 }
             )
-        prompt = prompt_template.format(**prompt_kwargs)
         response = self._llm_client.complete(
             model=self._models.for_filter_searches(),
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You select the most promising searches.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=self._build_messages(
+                template,
+                **prompt_kwargs,
+            ),
             response_format={"type": "json_object"},
             step_name="filter",
+            **self._cache_options(fresh),
         )
         keep_ids = parse_filter_ids(response.text)
         if not keep_ids:
             keep_ids = [task.id for task in candidate_tasks]
-        filtered_tasks = [task for task in candidate_tasks if task.id in keep_ids]
-        deduped = list(OrderedDict((task.id, task) for task in filtered_tasks).values())
-        if len(deduped) > target_filtered:
-            self._logger.warning(
-                "Filter returned %d tasks (target %d). Trimming locally.",
-                len(deduped),
-                target_filtered,
-            )
-            deduped = deduped[:target_filtered]
-        return SearchPlan(tasks=deduped)
+        # Preserve the model's ranking so local trimming drops the weakest IDs.
+        by_id = OrderedDict((task.id, task) for task in candidate_tasks)
+        ranked = [
+            by_id[task_id]
+            for task_id in dict.fromkeys(keep_ids)
+            if task_id in by_id
+        ]
+        return SearchPlan(tasks=ranked)
 
     def _apply_review(
         self,
@@ -388,20 +747,19 @@ class PipelineOrchestrator:
         review: dict,
         new_tasks: List[SearchTask],
     ) -> SearchPlan:
-        """Applies user adjustments to the plan."""
-        new_plan = SearchPlan(tasks=list(plan.tasks))
-        drop_ids = review.get("drop_ids") or []
+        """Applies user adjustments to the plan in place and returns it."""
+        drop_ids = set(review.get("drop_ids") or [])
         if drop_ids:
-            new_plan.remove_ids(drop_ids)
+            plan.remove_ids(drop_ids)
         for task in new_tasks:
-            new_plan.add_task(task)
+            plan.add_task(task)
         self._logger.info(
             "Plan after review: %d tasks (dropped %d, added %d).",
-            len(new_plan.tasks),
+            len(plan),
             len(drop_ids),
             len(new_tasks),
         )
-        return new_plan
+        return plan
 
     def _apply_candidate_changes(
         self,
@@ -426,7 +784,17 @@ class PipelineOrchestrator:
             new_tasks.append(new_task)
 
         updated_tasks.extend(new_tasks)
-        return updated_tasks, new_tasks
+        return self._dedupe_tasks(updated_tasks), new_tasks
+
+    def _dedupe_tasks(self, tasks: List[SearchTask]) -> List[SearchTask]:
+        """Drops tasks whose normalized query repeats an earlier task."""
+        unique: OrderedDict[str, SearchTask] = OrderedDict()
+        for task in tasks:
+            unique.setdefault(task.query.strip().lower(), task)
+        removed = len(tasks) - len(unique)
+        if removed:
+            self._logger.info("Removed %d duplicate candidate searches.", removed)
+        return list(unique.values())
 
     def _assign_task_ids(self, tasks: List[SearchTask]) -> None:
         """Assigns deterministic IDs to generated tasks."""
@@ -439,42 +807,80 @@ class PipelineOrchestrator:
         self,
         plan: SearchPlan,
         schema: Sequence[str],
+        request: UserRequest,
     ) -> ExecutionResult:
-        """Executes the approved search plan."""
-        rows: List[NormalizedRow] = []
+        """Executes the approved search plan, inserting rows as tasks finish."""
         summaries: List[SearchSummary] = []
+        # Earlier rounds' rows already sit in the database, so stop on what
+        # this round adds against the gap the refined output still has.
+        round_start = self._db.count()
+        remaining = max(1, request.min_items - len(self._refined_records))
+        stop_at = remaining * EARLY_STOP_FACTOR
 
-        max_workers = max(1, self._config.limits.worker_pool_size)
         futures = {}
-        with ThreadPoolExecutor(
-            max_workers=min(max_workers, len(plan.tasks) or 1)
-        ) as executor:
-            for task in plan.tasks:
-                self._logger.info("Submitting task %s (%s).", task.id, task.strategy)
-                future = executor.submit(self._search_executor.run_task, task, schema)
-                futures[future] = task
-
-            for future in as_completed(futures):
-                task = futures[future]
-                try:
-                    task_rows = future.result()
-                    note = ""
-                except Exception as exc:  # pragma: no cover - defensive logging
-                    self._io.display_status(
-                        f"Search task {task.id} failed with error: {exc}"
-                    )
-                    task_rows = []
-                    note = str(exc)
-                self._logger.info("Task %s returned %d rows.", task.id, len(task_rows))
-                rows.extend(task_rows)
-                summaries.append(
-                    SearchSummary(
-                        task=task,
-                        items_found=len(task_rows),
-                        note=note or None,
-                    )
+        for batch in self._search_batches(plan.tasks):
+            self._logger.info(
+                "Submitting task %s (%s).",
+                ", ".join(task.id for task in batch),
+                batch[0].strategy,
+            )
+            by_id = {task.id: task for task in batch}
+            for task_id, future in self._search_executor.submit_batch(
+                batch, schema
+            ).items():
+                futures[future] = by_id[task_id]
+
+        stopped_early = False
+        for future in as_completed(futures):
+            task = futures[future]
+            if future.cancelled():
+                continue
+            try:
+                task_rows = future.result()
+                note = ""
+            except Exception as exc:  # pragma: no cover - defensive logging
+                self._io.display_status(
+                    f"Search task {task.id} failed with error: {exc}"
+                )
+                task_rows = []
+                note = str(exc)
+            self._logger.info("Task %s returned %d rows.", task.id, len(task_rows))
+            self._db.extend(task_rows)
+            summaries.append(
+                SearchSummary(
+                    task=task,
+                    items_found=len(task_rows),
+                    note=note or None,
                 )
-        return ExecutionResult(rows=rows, summaries=summaries)
+            )
+            if not stopped_early and self._db.count() - round_start >= stop_at:
+                stopped_early = True
+                cancelled = sum(1 for pending in futures if pending.cancel())
+                if cancelled:
+                    self._logger.info(
+                        "Collected %d rows this round (stop threshold %d); "
+                        "cancelled %d queued tasks.",
+                        self._db.count() - round_start,
+                        stop_at,
+                        cancelled,
+                    )
+        return ExecutionResult(summaries=summaries)
+
+    def _search_batches(
+        self, tasks: Sequence[SearchTask]
+    ) -> List[List[SearchTask]]:
+        """Groups tasks by strategy into batches of search_batch_size."""
+        size = max(1, self._config.limits.search_batch_size)
+        if size == 1:
+            return [[task] for task in tasks]
+        by_strategy: Dict[str, List[SearchTask]] = {}
+        for task in tasks:
+            by_strategy.setdefault(task.strategy, []).append(task)
+        return [
+            group[start : start + size]
+            for group in by_strategy.values()
+            for start in range(0, len(group), size)
+        ]
 
     def _generate_retry_searches(
         self,
@@ -485,28 +891,22 @@ class PipelineOrchestrator:
         total_items: int,
     ) -> List[SearchTask]:
         """Generates additional searches after a shortfall."""
-        prompt_template = self._prompts.load("retry_searches")
+        template = self._templates["retry_searches"]
         performance_report = build_performance_report(
             total_items=total_items,
             summaries=execution.summaries,
             user_feedback=self._feedback_history[-1] if self._feedback_history else "",
         )
-        prompt = prompt_template.format(
-            description=request.description,
-            performance_report=performance_report,
-            schema=",".join(schema),
-            additional_feedback="\n".join(self._feedback_history),
-            per_batch=max(5, self._config.limits.per_batch // 2),
-        )
         response = self._llm_client.complete(
             model=self._models.for_generate_searches(),
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You refine web searches based on performance data.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=self._build_messages(
+                template,
+                description=request.description,
+                performance_report=performance_report,
+                schema=",".join(schema),
+                additional_feedback="\n".join(self._feedback_history),
+                per_batch=max(5, self._config.limits.per_batch // 2),
+            ),
             response_format={"type": "json_object"},
             step_name="retry",
         )
@@ -515,6 +915,72 @@ class PipelineOrchestrator:
         self._logger.info("Generated %d retry tasks.", len(tasks))
         return tasks
 
+    def _refine_collected(
+        self,
+        request: UserRequest,
+        schema: Sequence[str],
+    ) -> List[Dict[str, Any]]:
+        """Refines only rows added since the last call and merges the results.
+
+        The database is append-only, so rows before _refined_row_count have
+        already been refined; a schema change invalidates that output. New
+        rows are refined in slices of the refiner's max_records so none are
+        dropped by its per-call cap.
+        """
+        schema_key = tuple(schema)
+        if schema_key != self._refined_schema:
+            self._refined_records = []
+            self._refined_row_count = 0
+            self._refined_schema = schema_key
+        rows = self._db.rows()
+        slice_size = max(1, self._refiner.max_records)
+        while self._refined_row_count < len(rows):
+            new_rows = rows[
+                self._refined_row_count : self._refined_row_count + slice_size
+            ]
+            self._logger.info(
+                "Refining %d new rows (%d already refined, %d pending).",
+                len(new_rows),
+                self._refined_row_count,
+                len(rows) - self._refined_row_count,
+            )
+            refined = self._refiner.refine(new_rows, request, schema)
+            self._refined_records = self._refiner.merge_records(
+                self._refined_records,
+                refined,
+                request,
+            )
+            self._refined_row_count += len(new_rows)
+        return list(self._refined_records)
+
+    @staticmethod
+    def _debug_columns(schema: Sequence[str]) -> List[str]:
+        """Returns the schema plus the URL and domain columns, without repeats."""
+        return list(dict.fromkeys([*schema, "url", "source_domain"]))
+
+    @staticmethod
+    def _report_columns(
+        schema: Sequence[str],
+        records: Sequence[Dict[str, Any]],
+    ) -> List[str]:
+        """Orders report columns: name, schema fields, then extra record keys.
+
+        Extra keys keep their first-seen order; metadata columns are dropped
+        and the final dict.fromkeys removes any repeat of a schema column.
+        """
+        key_order: Dict[str, None] = {}
+        for record in records:
+            for key in record:
+                key_order.setdefault(key, None)
+        metadata = frozenset(METADATA_COLUMNS)
+        return list(
+            dict.fromkeys(
+                column
+                for column in ("name", *schema, *key_order)
+                if column not in metadata
+            )
+        )
+
     def _finalize(
         self,
         request: UserRequest,
@@ -525,18 +991,14 @@ class PipelineOrchestrator:
         refined_records: Optional[List[Dict[str, Any]]] = None,
     ) -> None:
         """Exports CSV and prints final status."""
-        debug_columns = list(schema)
-        for extra in ("url", "source_domain"):
-            if extra not in debug_columns:
-                debug_columns.append(extra)
         debug_path = self._debug_exporter.export_rows(
             self._db.rows(),
-            debug_columns,
+            self._debug_columns(schema),
             filename_prefix="debug",
         )
 
         if refined_records is None:
-            refined_records = self._refiner.refine(self._db.rows(), request, schema)
+            refined_records = self._refine_collected(request, schema)
         if not refined_records:
             self._logger.warning("Refiner returned no records; using raw rows.")
             refined_records = self._refiner.fallback_from_rows(
@@ -544,19 +1006,9 @@ class PipelineOrchestrator:
                 schema,
             )
 
-        metadata_fields = {"source_query_id", "source_strategy"}
-        report_columns = [column for column in schema if column not in metadata_fields]
-        key_order: List[str] = []
-        for record in refined_records:
-            for key in record.keys():
-                if key in metadata_fields or key in report_columns or key in key_order:
-                    continue
-                key_order.append(key)
-        report_columns = list(dict.fromkeys(["name"] + report_columns + key_order))
-
         report_path = self._report_exporter.export_dicts(
             refined_records,
-            report_columns,
+            self._report_columns(schema, refined_records),
             filename_prefix="report",
         )
 
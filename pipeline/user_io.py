@@ -6,6 +6,16 @@ from typing import Any, Callable, Dict, List, Optional
 
 from core.models import SearchPlan, UserRequest
 
+# Accepted spellings for each menu choice.
+_HELP = frozenset({"help", "h", "?"})
+_APPROVE = frozenset({"a", "approve"})
+_DROP = frozenset({"d", "drop"})
+_NEW = frozenset({"n", "new", "add"})
+_FEEDBACK = frozenset({"f", "feedback"})
+_REFILTER = frozenset({"g", "refilter"})
+# Dedupe columns that need not appear in a user-supplied schema.
+_SCHEMA_OPTIONAL_DEDUPE = frozenset({"name", "description"})
+
 
 class TerminalIO:
     """Handles terminal-based user input and output."""
@@ -65,7 +75,7 @@ class TerminalIO:
                 "[F]eedback, [G] Re-filter with feedback, [R]efresh, [H]elp"
             )
             choice = input("Select an option: ").strip().lower()
-            if choice in {"a", "approve"}:
+            if choice in _APPROVE:
                 return {
                     "approved": True,
                     "drop_ids": drop_ids,
@@ -74,19 +84,19 @@ class TerminalIO:
                     "regenerate": False,
                     "refilter": False,
                 }
-            if choice in {"d", "drop"}:
+            if choice in _DROP:
                 ids_raw = input("Enter IDs to drop (comma-separated): ").strip()
                 ids = [item.strip() for item in ids_raw.split(",") if item.strip()]
                 drop_ids.extend(ids)
                 plan.remove_ids(ids)
-            elif choice in {"n", "new", "add"}:
+            elif choice in _NEW:
                 new_query = input("Enter the new search query: ").strip()
                 if new_query:
                     new_queries.append(new_query)
                     print(f"Added new search query: {new_query}")
-            if choice in {"h", "help", "?"}:
+            if choice in _HELP:
                 self._print_review_help()
-            elif choice in {"f", "feedback"}:
+            elif choice in _FEEDBACK:
                 feedback_text = input("Enter feedback for the system: ").strip()
                 if feedback_text:
                     return {
@@ -97,7 +107,7 @@ class TerminalIO:
                         "regenerate": True,
                         "refilter": False,
                     }
-            elif choice in {"g", "refilter"}:
+            elif choice in _REFILTER:
                 filter_feedback = input(
                     "Enter feedback specifically for filtering: "
                 ).strip()
@@ -150,7 +160,7 @@ class TerminalIO:
     @staticmethod
     def _is_help(value: str) -> bool:
         """Returns True if the input represents a help request."""
-        return value.lower() in {"help", "h", "?"}
+        return value.lower() in _HELP
 
     @staticmethod
     def _print_description_help() -> None:
@@ -214,7 +224,11 @@ class TerminalIO:
             if not choice:
                 return "name"
             if choice in candidates:
-                if available and choice not in available and choice not in {"name", "description"}:
+                if (
+                    available
+                    and choice not in available
+                    and choice not in _SCHEMA_OPTIONAL_DEDUPE
+                ):
                     print(f"Column '{choice}' is not in the schema; please choose another.")
                     continue
                 picked = candidates[choice]
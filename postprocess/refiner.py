@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import logging
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from urllib.parse import urlparse
 
 from config import Config
@@ -16,6 +28,32 @@ from core.models import NormalizedRow, UserRequest
 from core.parser import parse_refined_companies
 from core.prompt_repository import PromptRepository
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None  # type: ignore
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+# Placeholder substituted for the candidates when pre-filling the template.
+_CANDIDATES_SENTINEL = "\x00candidate_json\x00"
+_ANCHOR_KEYS = frozenset({"name", "website"})
+_METADATA_FIELDS = frozenset({"source_query_id", "source_strategy"})
+# Fallback chains for the fields rows and records name inconsistently.
+_NAME_KEYS = ("name", "title", "company")
+_NAME_FALLBACK_KEYS = ("title", "company")
+_REFINED_NAME_KEYS = ("name", "title")
+_URL_KEYS = ("website", "url", "link")
+# URL-like dedupe fields mapped to their lookup order: the field itself first.
+_URL_DEDUPE_CHAINS = {
+    field: (field,) + tuple(key for key in _URL_KEYS if key != field)
+    for field in _URL_KEYS
+}
+_WEBSITE_KEYS = ("website", "url")
+_ROW_DOMAIN_KEYS = ("source_domain", "source")
+_INDEX_DOMAIN_KEYS = ("source_domain",)
+# Characters urlparse splits on or strips; strings without them parse as a path.
+_URL_SPLIT_CHARS = frozenset(":/?#;\t\r\n")
+
 
 class ResultRefiner:
     """Uses an LLM to deduplicate and clean result rows."""
@@ -35,7 +73,14 @@ class ResultRefiner:
         self._models = model_registry
         self._max_records = max_records
         self._logger = logging.getLogger(self.__class__.__name__)
-        self._chunk_size = 20
+        self._token_budget = max(1, config.limits.refine_token_budget)
+        # Parsed chunk results keyed by a digest of the exact prompt inputs.
+        self._chunk_cache: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+
+    @property
+    def max_records(self) -> int:
+        """Largest number of rows a single refine() call sends to the model."""
+        return self._max_records
 
     def refine(
         self,
@@ -48,22 +93,51 @@ class ResultRefiner:
         if not row_list:
             return []
 
-        schema_fields = [
-            column for column in schema if column not in {"source_query_id", "source_strategy"}
-        ]
-        records = self._rows_to_records(row_list, schema)
-        source_index = self._build_source_index(row_list, schema_fields)
-
-        prompt_template = self._prompts.load("refine_results")
+        # Resolved once here and threaded through every per-record helper.
+        dedupe_field = request.dedupe_field or "name"
+        schema_fields = tuple(
+            column for column in schema if column not in _METADATA_FIELDS
+        )
+        records, source_index = self._prepare_inputs(row_list, schema_fields)
+        if len(records) > self._max_records:
+            # source_index still covers every row, so truncated records keep
+            # their fill-in data.
+            self._logger.warning(
+                "Refiner received %d records; only the first %d are refined.",
+                len(records),
+                self._max_records,
+            )
+            records = records[: self._max_records]
+
+        # Only the candidates change between chunks, so the template is filled
+        # once and split around them.
+        prompt_prefix, _, prompt_suffix = (
+            self._prompts.load("refine_results")
+            .format(
+                user_description=request.description,
+                requested_columns=", ".join(request.columns or schema_fields),
+                schema_fields=", ".join(schema_fields),
+                candidate_json=_CANDIDATES_SENTINEL,
+            )
+            .partition(_CANDIDATES_SENTINEL)
+        )
         max_workers = max(1, self._config.limits.worker_pool_size)
-        chunks = list(self._chunk_records(records, self._chunk_size))
+        overhead = _estimate_tokens(prompt_prefix) + _estimate_tokens(prompt_suffix)
+        chunks = list(
+            self._chunk_records(records, max(1, self._token_budget - overhead))
+        )
         self._logger.info(
             "Refiner processing %d records across %d chunks.",
             len(records),
             len(chunks),
         )
 
-        chunk_results: Dict[int, List[Dict[str, Any]]] = {}
+        results: List[Optional[List[Tuple[str, Dict[str, Any]]]]] = [None] * len(
+            chunks
+        )
+        combined: List[Dict[str, Any]] = []
+        seen_keys: set[str] = set()
+        next_chunk = 0
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
                 executor.submit(
@@ -72,7 +146,9 @@ class ResultRefiner:
                     chunk,
                     request,
                     schema_fields,
-                    prompt_template,
+                    dedupe_field,
+                    prompt_prefix,
+                    prompt_suffix,
                 ): chunk_index
                 for chunk_index, chunk in enumerate(chunks)
             }
@@ -90,73 +166,118 @@ class ResultRefiner:
                         "Chunk %d returned no companies; applying heuristic fallback.",
                         idx,
                     )
-                    chunk_output = self._dedupe_records(chunks[idx])
-                chunk_results[idx] = chunk_output
-
-        combined: List[Dict[str, Any]] = []
-        for idx in range(len(chunks)):
-            combined.extend(chunk_results.get(idx, []))
+                    chunk_output = self._keyed_records(chunks[idx], dedupe_field)
+                results[idx] = chunk_output
+                # Dedupe each chunk into the output as soon as every earlier
+                # chunk is merged, so order stays deterministic without a
+                # final pass. Only this thread touches seen_keys.
+                while next_chunk < len(chunks) and results[next_chunk] is not None:
+                    for key, record in results[next_chunk]:
+                        if key not in seen_keys:
+                            seen_keys.add(key)
+                            combined.append(record)
+                    results[next_chunk] = []
+                    next_chunk += 1
 
-        dedupe_field = request.dedupe_field or "name"
         if not combined:
             self._logger.warning(
                 "No refined companies returned across all chunks, using fallback."
             )
             combined = self._dedupe_records(records, dedupe_field)
-        else:
-            combined = self._dedupe_records(combined, dedupe_field)
 
         normalized = self._normalize_records(combined, schema_fields, source_index)
         self._logger.info("Refined %d companies.", len(normalized))
         return normalized
 
+    def merge_records(
+        self,
+        existing: Sequence[Dict[str, Any]],
+        additions: Sequence[Dict[str, Any]],
+        request: UserRequest,
+    ) -> List[Dict[str, Any]]:
+        """Appends newly refined records, dropping ones already present."""
+        return self._dedupe_records(
+            [*existing, *additions],
+            request.dedupe_field or "name",
+        )
+
     def fallback_from_rows(
         self,
         rows: Iterable[NormalizedRow],
         schema: Sequence[str],
     ) -> List[Dict[str, Any]]:
         """Public helper that produces a heuristic fallback from raw rows."""
-        schema_fields = [
-            column for column in schema if column not in {"source_query_id", "source_strategy"}
-        ]
-        row_list = list(rows)
-        records = self._rows_to_records(row_list, schema)
-        source_index = self._build_source_index(row_list, schema_fields)
+        schema_fields = tuple(
+            column for column in schema if column not in _METADATA_FIELDS
+        )
+        records, source_index = self._prepare_inputs(rows, schema_fields)
         return self._normalize_records(
             self._dedupe_records(records, dedupe_field="name"),
             schema_fields,
             source_index,
         )
 
-    def _rows_to_records(
-        self,
+    @staticmethod
+    def _prepare_inputs(
         rows: Iterable[NormalizedRow],
-        schema: Sequence[str],
-    ) -> List[Dict[str, Any]]:
-        """Converts normalized rows into rough records."""
-        return [
-            _row_to_record(
-                row,
-                schema,
-            )
-            for row in rows
-        ]
+        schema_fields: Tuple[str, ...],
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Builds refiner records and the name-keyed source index in one pass."""
+        fill = _fill_plan(schema_fields)
+        records: List[Dict[str, Any]] = []
+        index: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            records.append(_row_to_record(row, schema_fields, fill))
+            values = row.values
+            key = _first(values, _NAME_KEYS).strip().lower()
+            if key and key not in index:
+                index[key] = _source_entry(values, schema_fields, fill)
+        return records, index
 
+    @staticmethod
     def _chunk_records(
-        self, records: List[Dict[str, Any]], chunk_size: int
+        records: List[Dict[str, Any]], token_budget: int
     ) -> Iterable[List[Dict[str, Any]]]:
-        for offset in range(0, len(records), chunk_size):
-            yield records[offset : offset + chunk_size]
+        """Greedily packs records into chunks whose estimated size fits the budget.
+
+        A single record larger than the budget still gets a chunk of its own.
+        """
+        chunk: List[Dict[str, Any]] = []
+        used = 0
+        for record in records:
+            cost = _estimate_record_tokens(record)
+            if chunk and used + cost > token_budget:
+                yield chunk
+                chunk, used = [], 0
+            chunk.append(record)
+            used += cost
+        if chunk:
+            yield chunk
 
     def _refine_chunk(
         self,
         chunk_index: int,
         records: List[Dict[str, Any]],
         request: UserRequest,
-        schema_fields: Sequence[str],
-        prompt_template: str,
-    ) -> List[Dict[str, Any]]:
-        candidate_json = json.dumps(records, indent=2)
+        schema_fields: Tuple[str, ...],
+        dedupe_field: str,
+        prompt_prefix: str,
+        prompt_suffix: str,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Refines one chunk, returning (dedupe key, record) pairs."""
+        candidate_json = _dump_candidates(
+            [_compact_record(record) for record in records]
+        )
+        cache_key = self._chunk_cache_key(
+            candidate_json,
+            request,
+            schema_fields,
+            dedupe_field,
+        )
+        cached = self._chunk_cache.get(cache_key)
+        if cached is not None:
+            self._logger.debug("Reusing refined output for chunk %d.", chunk_index)
+            return list(cached)
         messages = [
             {
                 "role": "system",
@@ -167,12 +288,7 @@ class ResultRefiner:
             },
             {
                 "role": "user",
-                "content": prompt_template.format(
-                    user_description=request.description,
-                    requested_columns=", ".join(request.columns or schema_fields),
-                    schema_fields=", ".join(schema_fields),
-                    candidate_json=candidate_json,
-                ),
+                "content": prompt_prefix + candidate_json + prompt_suffix,
             },
         ]
         result = self._llm_client.complete(
@@ -183,118 +299,109 @@ class ResultRefiner:
             metadata={"record_count": len(records)},
         )
         refined = parse_refined_companies(result.text)
-        return self._dedupe_records(refined, dedupe_field=request.dedupe_field or "name")
+        deduped = self._keyed_records(refined, dedupe_field)
+        if deduped:
+            # Empty output falls back to heuristics; leave it retryable.
+            self._chunk_cache[cache_key] = deduped
+        return list(deduped)
+
+    @staticmethod
+    def _chunk_cache_key(
+        candidate_json: str,
+        request: UserRequest,
+        schema_fields: Tuple[str, ...],
+        dedupe_field: str,
+    ) -> str:
+        """Digests every input that shapes a chunk's refinement prompt."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (
+            candidate_json,
+            request.description,
+            ",".join(request.columns or ()),
+            ",".join(schema_fields),
+            dedupe_field,
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
 
     def _dedupe_records(
         self,
         records: Iterable[Dict[str, Any]],
         dedupe_field: str,
     ) -> List[Dict[str, Any]]:
-        seen: Dict[str, Dict[str, Any]] = {}
-        deduped: List[Dict[str, Any]] = []
+        return [record for _, record in self._keyed_records(records, dedupe_field)]
+
+    def _keyed_records(
+        self,
+        records: Iterable[Dict[str, Any]],
+        dedupe_field: str,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Dedupes records, keeping each survivor's key for later merges."""
+        seen: set[str] = set()
+        keyed: List[Tuple[str, Dict[str, Any]]] = []
         for record in records:
             key = self._dedupe_key(record, dedupe_field)
             if key in seen:
                 continue
-            seen[key] = record
-            deduped.append(record)
-        return deduped
+            seen.add(key)
+            keyed.append((key, record))
+        return keyed
 
     def _dedupe_key(self, record: Dict[str, Any], dedupe_field: str) -> str:
-        if dedupe_field in {"website", "link", "url"}:
-            email = str(record.get("email") or "").strip().lower()
+        url_chain = _URL_DEDUPE_CHAINS.get(dedupe_field)
+        if url_chain is not None:
+            email = record.get("email")
             if email:
-                return email
-            value = str(record.get(dedupe_field) or record.get("website") or record.get("url") or record.get("link") or "")
-            return self._extract_domain(value)
+                email = str(email).strip().lower()
+                if email:
+                    return email
+            value = _first(record, url_chain)
+            return _extract_domain(value if isinstance(value, str) else str(value))
         if dedupe_field == "email":
-            return str(record.get("email") or "").strip().lower()
+            email = record.get("email")
+            return str(email).strip().lower() if email else ""
         if dedupe_field == "description":
             return self._normalize_name(str(record.get("description") or ""))
         return self._normalize_name(str(record.get("name") or record.get("title") or ""))
 
     @staticmethod
     def _normalize_name(text: str) -> str:
-        return re.sub(r"[^a-z0-9]", "", text.lower()) if text else ""
-
-    @staticmethod
-    def _extract_domain(url: str) -> str:
-        if not url:
-            return ""
-        parsed = urlparse(url)
-        host = parsed.netloc or parsed.path
-        return host.lower()
-
-    @staticmethod
-    def _build_source_index(
-        rows: Iterable[NormalizedRow],
-        schema_fields: Sequence[str],
-    ) -> Dict[str, Dict[str, Any]]:
-        """Builds a mapping from normalized name to original row values."""
-        index: Dict[str, Dict[str, Any]] = {}
-        for row in rows:
-            values = dict(row.values)
-            name = (
-                values.get("name")
-                or values.get("title")
-                or values.get("company")
-                or ""
-            )
-            key = name.strip().lower()
-            if not key or key in index:
-                continue
-            record = {field: values.get(field, "") for field in schema_fields}
-            url = values.get("website") or values.get("url") or values.get("link") or ""
-            if url:
-                record.setdefault("website", url)
-                record.setdefault("link", url)
-            source_domain = values.get("source_domain")
-            if source_domain:
-                record.setdefault("source_domain", source_domain)
-            email = values.get("email")
-            if email:
-                record.setdefault("email", email)
-            index[key] = record
-        return index
+        return _NON_ALNUM_RE.sub("", text.lower()) if text else ""
 
     @staticmethod
     def _normalize_records(
         records: Iterable[Dict[str, Any]],
-        schema_fields: Sequence[str],
+        schema_fields: Tuple[str, ...],
         source_index: Dict[str, Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
         """Normalizes refined records to match schema fields, filling gaps."""
+        fill = _fill_plan(schema_fields)
+        value_fields = tuple(field for field in schema_fields if field != "name")
         normalized: List[Dict[str, Any]] = []
         for record in records:
-            name = (
-                str(record.get("name") or record.get("title") or "").strip()
-            )
+            name = str(_first(record, _REFINED_NAME_KEYS)).strip()
             if not name:
                 continue
             key = name.lower()
             source_data = source_index.get(key, {})
             merged: Dict[str, Any] = {"name": name}
-            for field in schema_fields:
-                if field == "name":
-                    continue
+            for field in value_fields:
                 value = record.get(field)
                 if value in (None, ""):
                     value = source_data.get(field, "")
                 merged[field] = _to_text(value)
 
-            website = (
-                record.get("website")
-                or record.get("url")
-                or source_data.get("website")
-                or source_data.get("url")
-                or ""
+            website = _first(record, _WEBSITE_KEYS) or _first(
+                source_data, _WEBSITE_KEYS
             )
-            if website:
-                merged.setdefault("website", _to_text(website))
+            if website and "website" in fill.url_keys:
+                merged["website"] = _to_text(website)
 
-            link = record.get("link") or source_data.get("link") or website
-            if link:
-                merged.setdefault("link", _to_text(link))
+            if "link" in fill.url_keys:
+                link = record.get("link") or source_data.get("link") or website
+                if link:
+                    merged["link"] = _to_text(link)
 
             email = record.get("email") or source_data.get("email")
             if email:
@@ -304,39 +411,141 @@ class ResultRefiner:
         return normalized
 
 
+class _FillPlan(NamedTuple):
+    """Derived fields a schema leaves for the refiner to fill from row data."""
+
+    url_keys: Tuple[str, ...]
+    domain: bool
+    email: bool
+
+
+def _fill_plan(schema_fields: Sequence[str]) -> _FillPlan:
+    """Works out once per call which derived fields the schema lacks.
+
+    Schema fields are always written first, so a derived value only ever
+    lands in a key the schema does not already provide.
+    """
+    present = frozenset(schema_fields)
+    return _FillPlan(
+        url_keys=tuple(key for key in ("website", "link") if key not in present),
+        domain="source_domain" not in present,
+        email="email" not in present,
+    )
+
+
 def _row_to_record(
     row: NormalizedRow,
-    schema: Sequence[str],
+    schema_fields: Sequence[str],
+    fill: _FillPlan,
 ) -> Dict[str, Any]:
     """Converts a NormalizedRow into a record for the refiner."""
-    values = dict(row.values)
+    values = row.values
     record: Dict[str, Any] = {
         "source_query_id": row.source_query_id,
         "source_strategy": row.source_strategy,
+        **{field: values.get(field, "") for field in schema_fields},
     }
-    for field in schema:
-        if field in {"source_query_id", "source_strategy"}:
-            continue
-        record[field] = values.get(field, "")
-
     if not record.get("name"):
-        record["name"] = (
-            values.get("title") or values.get("company") or row.source_query_id
-        )
+        record["name"] = _first(values, _NAME_FALLBACK_KEYS) or row.source_query_id
+    _fill_derived(record, values, fill, _ROW_DOMAIN_KEYS)
+    return record
+
 
-    url = values.get("website") or values.get("url") or values.get("link") or ""
-    if url:
-        record.setdefault("website", url)
-        record.setdefault("link", url)
-    source_domain = values.get("source_domain") or values.get("source")
-    if source_domain:
-        record.setdefault("source_domain", source_domain)
-    email = values.get("email")
-    if email:
-        record.setdefault("email", email)
+def _source_entry(
+    values: Mapping[str, str],
+    schema_fields: Sequence[str],
+    fill: _FillPlan,
+) -> Dict[str, Any]:
+    """Captures a row's original values for filling gaps in refined records."""
+    record = {field: values.get(field, "") for field in schema_fields}
+    _fill_derived(record, values, fill, _INDEX_DOMAIN_KEYS)
     return record
 
 
+def _fill_derived(
+    record: Dict[str, Any],
+    values: Mapping[str, str],
+    fill: _FillPlan,
+    domain_keys: Sequence[str],
+) -> None:
+    """Writes URL, domain and email values into keys the schema left open."""
+    if fill.url_keys:
+        url = _first(values, _URL_KEYS)
+        if url:
+            for key in fill.url_keys:
+                record[key] = url
+    if fill.domain:
+        source_domain = _first(values, domain_keys)
+        if source_domain:
+            record["source_domain"] = source_domain
+    if fill.email:
+        email = values.get("email")
+        if email:
+            record["email"] = email
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_domain(url: str) -> str:
+    """Returns the lower-cased host of a URL, memoized across dedupe passes."""
+    if not url:
+        return ""
+    if url[0] > " " and _URL_SPLIT_CHARS.isdisjoint(url):
+        # Without a delimiter or leading whitespace for urlparse to split or
+        # strip, it would return the whole string as the path.
+        return url.lower()
+    parsed = urlparse(url)
+    host = parsed.netloc or parsed.path
+    return host.lower()
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count using the common four-characters-per-token rule."""
+    return len(text) // 4
+
+
+def _estimate_record_tokens(record: Mapping[str, Any]) -> int:
+    """Estimates a record's compact-JSON token cost without serializing it."""
+    # Six characters cover the quotes, colon and comma around each pair.
+    return 1 + sum(
+        len(key) + len(str(value)) + 6
+        for key, value in _compact_record(record).items()
+    ) // 4
+
+
+def _dump_candidates(candidates: List[Dict[str, Any]]) -> str:
+    """Serializes candidates as compact JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(candidates, default=str).decode("utf-8")
+    return json.dumps(
+        candidates,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+def _compact_record(record: Mapping[str, Any]) -> Dict[str, Any]:
+    """Drops empty values from a candidate sent to the LLM.
+
+    The prompt lists the full schema separately, so empty fields carry no
+    information; name and website are kept as dedupe anchors.
+    """
+    return {
+        key: value
+        for key, value in record.items()
+        if key in _ANCHOR_KEYS or value not in (None, "", [])
+    }
+
+
+def _first(mapping: Mapping[str, Any], keys: Sequence[str]) -> Any:
+    """Returns the first truthy value among keys, or an empty string."""
+    for key in keys:
+        value = mapping.get(key)
+        if value:
+            return value
+    return ""
+
+
 def _to_text(value: Any) -> str:
     """Converts any value to a trimmed string."""
     if value is None:
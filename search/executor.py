@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import logging
 import re
-from typing import Any, Dict, List, Sequence
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence
 
-from core.llm_client import LLMClient
+from core.llm_client import LLMClient, LLMResult
 from core.model_registry import ModelRegistry
 from core.models import NormalizedRow, SearchTask
 
+try:
+    import orjson
+    from orjson import JSONDecodeError, loads as _json_loads
+except ImportError:  # pragma: no cover - falls back to the stdlib codec
+    orjson = None  # type: ignore
+    from json import JSONDecodeError, loads as _json_loads
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# Web-search responses kept in memory for identical repeat requests.
+_RESPONSE_CACHE_SIZE = 512
+
 
 class SearchExecutor:
     """Executes web searches for the approved search tasks."""
@@ -22,11 +38,17 @@ class SearchExecutor:
         strategy_map: Dict[str, Dict[str, str]],
         *,
         use_mock_search: bool = False,
+        cache_enabled: bool = True,
     ) -> None:
         self._llm_client = llm_client
         self._model_registry = model_registry
         self._strategy_map = strategy_map
         self._use_mock_search = use_mock_search
+        self._cache_enabled = cache_enabled
+        # LRU of responses keyed by request digest; callbacks on the LLM
+        # event loop and pool threads both touch it.
+        self._response_cache: OrderedDict[str, LLMResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
         self._logger = logging.getLogger(self.__class__.__name__)
 
     def run_task(
@@ -38,6 +60,229 @@ class SearchExecutor:
         if self._use_mock_search:
             return self._mock_results(task, schema)
 
+        request = self._task_request(task, schema)
+        cache_key = self._response_key(request)
+        result = self._cached_response(cache_key)
+        if result is not None:
+            return self._parse_results(result.text, result.raw, schema, task)
+        result = self._llm_client.complete(**request)
+        rows = self._parse_results(result.text, result.raw, schema, task)
+        if rows:
+            self._cache_response(cache_key, result)
+        return rows
+
+    def submit_task(
+        self,
+        task: SearchTask,
+        schema: Sequence[str],
+    ) -> Future[List[NormalizedRow]]:
+        """Schedules the task on the LLM client's event loop.
+
+        No thread is held while the request is in flight, so every task of a
+        plan can be outstanding at once. Cancelling the returned future
+        cancels the underlying request.
+        """
+        rows_future: Future[List[NormalizedRow]] = Future()
+        if self._use_mock_search:
+            rows_future.set_result(self._mock_results(task, schema))
+            return rows_future
+
+        request = self._task_request(task, schema)
+        cache_key = self._response_key(request)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            rows_future.set_result(
+                self._parse_results(cached.text, cached.raw, schema, task)
+            )
+            return rows_future
+
+        llm_future = self._llm_client.submit(**request)
+
+        def parse(done: Future[LLMResult]) -> None:
+            if not rows_future.set_running_or_notify_cancel():
+                return
+            try:
+                result = done.result()
+                rows = self._parse_results(result.text, result.raw, schema, task)
+            except BaseException as error:
+                rows_future.set_exception(error)
+                return
+            if rows:
+                self._cache_response(cache_key, result)
+            rows_future.set_result(rows)
+
+        rows_future.add_done_callback(
+            lambda done: llm_future.cancel() if done.cancelled() else None
+        )
+        llm_future.add_done_callback(parse)
+        return rows_future
+
+    def run_batch(
+        self,
+        tasks: Sequence[SearchTask],
+        schema: Sequence[str],
+    ) -> Dict[str, List[NormalizedRow]]:
+        """Runs several tasks through one request and returns rows by task ID."""
+        futures = self.submit_batch(tasks, schema)
+        return {task_id: future.result() for task_id, future in futures.items()}
+
+    def submit_batch(
+        self,
+        tasks: Sequence[SearchTask],
+        schema: Sequence[str],
+    ) -> Dict[str, Future[List[NormalizedRow]]]:
+        """Schedules several tasks as one request, returning a future per task ID.
+
+        Tasks the response leaves out are re-submitted on their own. The
+        shared request is cancelled once every task future is cancelled.
+        """
+        if len(tasks) <= 1 or self._use_mock_search:
+            return {task.id: self.submit_task(task, schema) for task in tasks}
+
+        task_futures: Dict[str, Future[List[NormalizedRow]]] = {
+            task.id: Future() for task in tasks
+        }
+        llm_future = self._llm_client.submit(**self._batch_request(tasks, schema))
+
+        def forward(
+            source: Future[List[NormalizedRow]],
+            target: Future[List[NormalizedRow]],
+        ) -> None:
+            try:
+                target.set_result(source.result())
+            except BaseException as error:
+                target.set_exception(error)
+
+        def dispatch(done: Future[LLMResult]) -> None:
+            running = {
+                task.id: task
+                for task in tasks
+                if task_futures[task.id].set_running_or_notify_cancel()
+            }
+            try:
+                grouped = self._parse_batch_items(done.result().text, schema, running)
+            except BaseException as error:
+                for task_id in running:
+                    task_futures[task_id].set_exception(error)
+                return
+            for task_id, task in running.items():
+                rows = grouped.get(task_id)
+                if rows is not None:
+                    task_futures[task_id].set_result(rows)
+                    continue
+                self._logger.debug(
+                    "Task %s missing from batch response; running it alone.", task_id
+                )
+                retry = self.submit_task(task, schema)
+                retry.add_done_callback(
+                    lambda source, target=task_futures[task_id]: forward(source, target)
+                )
+
+        def cancel_if_abandoned(_: Future[List[NormalizedRow]]) -> None:
+            if all(future.cancelled() for future in task_futures.values()):
+                llm_future.cancel()
+
+        for future in task_futures.values():
+            future.add_done_callback(cancel_if_abandoned)
+        llm_future.add_done_callback(dispatch)
+        return task_futures
+
+    def _batch_request(
+        self,
+        tasks: Sequence[SearchTask],
+        schema: Sequence[str],
+    ) -> Dict[str, Any]:
+        """Builds the LLM call arguments for a multi-query search request."""
+        system_prompt = (
+            "You are a researcher using the OpenAI web search tool. "
+            "Run every query in the payload separately. Return JSON with a "
+            "`results` array holding one object per query, each with its "
+            "`query_id` and an `items` array. Each item should include the "
+            "schema fields plus `title`, `url`, `snippet`, and `source`."
+        )
+        user_payload = {
+            "queries": [
+                {
+                    "id": task.id,
+                    "query": task.query,
+                    "strategy": task.strategy,
+                    "parameters": self._strategy_map.get(task.strategy, {}),
+                }
+                for task in tasks
+            ],
+            "schema": list(schema),
+        }
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {
+                "role": "user",
+                "content": (
+                    "Execute the queries and return results as JSON. "
+                    "Payload:\n" + _dump_payload(user_payload)
+                ),
+            },
+        ]
+        return {
+            "model": self._model_registry.for_web(),
+            "messages": messages,
+            "response_format": {"type": "json_object"},
+            "tools": [{"type": "web_search"}],
+            "step_name": f"web_batch_{tasks[0].id}",
+            "metadata": {
+                "queries": [task.query for task in tasks],
+                "strategy": tasks[0].strategy,
+            },
+        }
+
+    def _response_key(self, request: Dict[str, Any]) -> Optional[str]:
+        """Digests the request fields that determine the response."""
+        if not self._cache_enabled:
+            return None
+        canonical = {
+            "model": request["model"],
+            "messages": request["messages"],
+            "response_format": request["response_format"],
+            "tools": request["tools"],
+        }
+        if orjson is not None:
+            data = orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)
+        else:
+            data = json.dumps(
+                canonical,
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _cached_response(self, cache_key: Optional[str]) -> Optional[LLMResult]:
+        """Returns a memoized response, marking it most recently used."""
+        if cache_key is None:
+            return None
+        with self._cache_lock:
+            result = self._response_cache.get(cache_key)
+            if result is not None:
+                self._response_cache.move_to_end(cache_key)
+        if result is not None:
+            self._logger.debug("Reusing cached web-search response.")
+        return result
+
+    def _cache_response(self, cache_key: Optional[str], result: LLMResult) -> None:
+        """Stores a response, evicting the least recently used beyond the cap."""
+        if cache_key is None:
+            return
+        with self._cache_lock:
+            self._response_cache[cache_key] = result
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def _task_request(
+        self,
+        task: SearchTask,
+        schema: Sequence[str],
+    ) -> Dict[str, Any]:
+        """Builds the LLM call arguments for a single search task."""
         strategy_params = self._strategy_map.get(task.strategy, {})
         system_prompt = (
             "You are a researcher using the OpenAI web search tool. "
@@ -56,21 +301,18 @@ class SearchExecutor:
                 "role": "user",
                 "content": (
                     "Execute the query and return results as JSON. "
-                    "Payload:\n" + json.dumps(user_payload)
+                    "Payload:\n" + _dump_payload(user_payload)
                 ),
             },
         ]
-        response_format = {"type": "json_object"}
-        tools = [{"type": "web_search"}]
-        result = self._llm_client.complete(
-            model=self._model_registry.for_web(),
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            step_name=f"web_{task.id}",
-            metadata={"query": task.query, "strategy": task.strategy},
-        )
-        return self._parse_results(result.text, result.raw, schema, task)
+        return {
+            "model": self._model_registry.for_web(),
+            "messages": messages,
+            "response_format": {"type": "json_object"},
+            "tools": [{"type": "web_search"}],
+            "step_name": f"web_{task.id}",
+            "metadata": {"query": task.query, "strategy": task.strategy},
+        }
 
     def _parse_results(
         self,
@@ -80,13 +322,16 @@ class SearchExecutor:
         task: SearchTask,
     ) -> List[NormalizedRow]:
         """Parses the payload and returns normalized rows."""
-        rows = self._parse_json_items(raw_text, schema, task)
+        schema_set = frozenset(schema)
+        rows = list(self._parse_json_items(raw_text, schema, schema_set, task))
         if rows:
             self._logger.debug(
                 "Task %s parsed %d rows via JSON output.", task.id, len(rows)
             )
             return rows
-        rows = self._parse_from_annotations(raw_payload, schema, task)
+        rows = list(
+            self._parse_from_annotations(raw_payload, schema, schema_set, task)
+        )
         self._logger.debug(
             "Task %s parsed %d rows via annotations fallback.", task.id, len(rows)
         )
@@ -96,67 +341,105 @@ class SearchExecutor:
         self,
         raw_text: str,
         schema: Sequence[str],
+        schema_set: FrozenSet[str],
         task: SearchTask,
-    ) -> List[NormalizedRow]:
+    ) -> Iterator[NormalizedRow]:
         """Attempts to parse structured JSON returned by the model."""
-        if raw_text.strip():
-            try:
-                payload = json.loads(raw_text)
-            except json.JSONDecodeError:
-                payload = None
-            if isinstance(payload, dict):
-                items = payload.get("items")
-                if isinstance(items, list):
-                    rows: List[NormalizedRow] = []
-                    for item in items:
-                        if not isinstance(item, dict):
-                            continue
-                        values = {
-                            column: str(item.get(column, "") or "")
-                            for column in schema
-                        }
-                        title = str(
-                            item.get("title")
-                            or item.get("name")
-                            or values.get("name")
-                            or ""
-                        )
-                        title = self._clean_text(title)
-                        if title:
-                            values.setdefault("name", title)
-                            values.setdefault("title", title)
-                        snippet = str(item.get("snippet") or "")
-                        snippet = self._clean_text(snippet)
-                        if "description" in values and not values["description"]:
-                            values["description"] = snippet or title
-                        url = str(item.get("url") or item.get("link") or "")
-                        url = url.strip()
-                        if url:
-                            values["url"] = url
-                            values["source_domain"] = self._extract_domain(url)
-                            if "source" in values and not values["source"]:
-                                values["source"] = values["source_domain"]
-                        rows.append(
-                            NormalizedRow(
-                                values=values,
-                                source_query_id=task.id,
-                                source_strategy=task.strategy,
-                            )
-                        )
-                    return rows
-        return []
+        if not _looks_like_object(raw_text):
+            return
+        try:
+            payload = _json_loads(raw_text)
+        except JSONDecodeError:
+            return
+        if isinstance(payload, dict):
+            items = payload.get("items")
+            if isinstance(items, list):
+                yield from self._rows_from_items(items, schema, schema_set, task)
+
+    def _parse_batch_items(
+        self,
+        raw_text: str,
+        schema: Sequence[str],
+        tasks: Dict[str, SearchTask],
+    ) -> Dict[str, List[NormalizedRow]]:
+        """Parses a multi-query response into rows keyed by task ID."""
+        grouped: Dict[str, List[NormalizedRow]] = {}
+        if not _looks_like_object(raw_text):
+            return grouped
+        try:
+            payload = _json_loads(raw_text)
+        except JSONDecodeError:
+            return grouped
+        results = payload.get("results") if isinstance(payload, dict) else None
+        if not isinstance(results, list):
+            return grouped
+        schema_set = frozenset(schema)
+        for result in results:
+            if not isinstance(result, dict):
+                continue
+            task = tasks.get(str(result.get("query_id") or result.get("id") or ""))
+            items = result.get("items")
+            if task is None or not isinstance(items, list):
+                continue
+            grouped.setdefault(task.id, []).extend(
+                self._rows_from_items(items, schema, schema_set, task)
+            )
+        return grouped
+
+    def _rows_from_items(
+        self,
+        items: List[Any],
+        schema: Sequence[str],
+        schema_set: FrozenSet[str],
+        task: SearchTask,
+    ) -> Iterator[NormalizedRow]:
+        """Normalizes decoded result items for the given task."""
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            values = dict.fromkeys(schema, "")
+            for column in schema_set & item.keys():
+                value = item[column]
+                if value:
+                    values[column] = value if isinstance(value, str) else str(value)
+            title = str(
+                item.get("title")
+                or item.get("name")
+                or values.get("name")
+                or ""
+            )
+            title = _clean_text(title)
+            if title:
+                values.setdefault("name", title)
+                values.setdefault("title", title)
+            snippet = str(item.get("snippet") or "")
+            snippet = _clean_text(snippet)
+            if "description" in schema_set and not values["description"]:
+                values["description"] = snippet or title
+            url = str(item.get("url") or item.get("link") or "")
+            url = url.strip()
+            if url:
+                values["url"] = url
+                values["source_domain"] = _extract_domain(url)
+                if "source" in schema_set and not values["source"]:
+                    values["source"] = values["source_domain"]
+            yield NormalizedRow(
+                values=values,
+                source_query_id=task.id,
+                source_strategy=task.strategy,
+            )
 
     def _parse_from_annotations(
         self,
         raw_payload: Dict[str, Any],
         schema: Sequence[str],
+        schema_set: FrozenSet[str],
         task: SearchTask,
-    ) -> List[NormalizedRow]:
+    ) -> Iterator[NormalizedRow]:
         """Builds rows from citation annotations when JSON is unavailable."""
         output_blocks = raw_payload.get("output")
         if not isinstance(output_blocks, list):
-            return []
-        rows: List[NormalizedRow] = []
+            return
         for block in output_blocks:
             if not isinstance(block, dict):
                 continue
@@ -182,46 +465,34 @@ class SearchExecutor:
                         annotation.get("start_index"),
                         annotation.get("end_index"),
                     )
-                    rows.append(
-                        NormalizedRow(
-                            values=self._build_values(schema, annotation, snippet),
-                            source_query_id=task.id,
-                            source_strategy=task.strategy,
-                        )
+                    yield NormalizedRow(
+                        values=self._build_values(
+                            schema, schema_set, annotation, snippet
+                        ),
+                        source_query_id=task.id,
+                        source_strategy=task.strategy,
                     )
-        return rows
 
     def _build_values(
         self,
         schema: Sequence[str],
+        schema_set: FrozenSet[str],
         annotation: Dict[str, Any],
         snippet: str,
     ) -> Dict[str, str]:
         """Constructs schema-aligned values from an annotation."""
-        values = {column: "" for column in schema}
-        title = self._clean_text(str(annotation.get("title", "") or ""))
+        values = dict.fromkeys(schema, "")
+        title = _clean_text(str(annotation.get("title", "") or ""))
         url = str(annotation.get("url", "") or "").strip()
-        domain = self._extract_domain(url) if url else ""
+        domain = _extract_domain(url) if url else ""
 
-        if "name" in values:
-            values["name"] = title
-        else:
-            values["name"] = title
-        if "title" in values and not values["title"]:
-            values["title"] = title
-        else:
-            values.setdefault("title", title)
-        if "url" in values:
-            values["url"] = url
+        # Each derived field is written once, whether or not the schema has it.
+        values["name"] = title
+        values["title"] = title
         values["url"] = url
-        if "link" in values and not values["link"]:
-            values["link"] = url
-        values.setdefault("link", url)
-        if "description" in values:
-            values["description"] = self._clean_text(snippet or title)
-        else:
-            values.setdefault("description", self._clean_text(snippet or title))
-        if "source" in values and domain:
+        values["link"] = url
+        values["description"] = _clean_text(snippet or title)
+        if domain and "source" in schema_set:
             values["source"] = domain
         values["source_domain"] = domain
         return values
@@ -238,16 +509,12 @@ class SearchExecutor:
     @staticmethod
     def _extract_domain(url: str) -> str:
         """Extracts the domain portion of a URL."""
-        if "://" in url:
-            url = url.split("://", 1)[1]
-        return url.split("/", 1)[0]
+        return _extract_domain(url)
 
     @staticmethod
     def _clean_text(text: str) -> str:
         """Removes basic Markdown markers from a snippet."""
-        text = re.sub(r"\[(.*?)\]\((.*?)\)", r"\1", text)
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
+        return _clean_text(text)
 
     def _mock_results(
         self,
@@ -255,10 +522,72 @@ class SearchExecutor:
         schema: Sequence[str],
     ) -> List[NormalizedRow]:
         """Returns deterministic mock results for testing."""
-        values = {column: f"{task.query} - {column}" for column in schema}
+        prefix = task.query + " - "
+        values = {column: prefix + column for column in schema}
         row = NormalizedRow(
             values=values,
             source_query_id=task.id,
             source_strategy=task.strategy,
         )
         return [row]
+
+
+def _looks_like_object(raw_text: str) -> bool:
+    """Cheaply rules out prose responses before attempting a JSON decode.
+
+    Only a JSON object can carry results, so anything else is skipped.
+    """
+    return raw_text.lstrip()[:1] == "{"
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_domain(url: str) -> str:
+    """Extracts the domain portion of a URL, memoized across rows."""
+    start = url.find("://")
+    start = 0 if start < 0 else start + 3
+    end = url.find("/", start)
+    return url[start:] if end < 0 else url[start:end]
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_text(text: str) -> str:
+    """Removes basic Markdown markers, memoized since titles recur across searches."""
+    text = _strip_md_links(text)
+    text = _WHITESPACE_RE.sub(" ", text)
+    return text.strip()
+
+
+def _strip_md_links(text: str) -> str:
+    """Replaces ``[label](target)`` with ``label`` in a single forward scan.
+
+    Matches ``re.sub(r"\[(.*?)\]\((.*?)\)", r"\1", text)`` without
+    backtracking: a link never spans a newline, so each ``[`` needs a ``](``
+    and then a ``)`` before the end of its line.
+    """
+    if "](" not in text:
+        return text
+    parts: List[str] = []
+    copied = 0
+    start = text.find("[")
+    while start != -1:
+        line_end = text.find("\n", start)
+        if line_end == -1:
+            line_end = len(text)
+        middle = text.find("](", start + 1, line_end)
+        close = text.find(")", middle + 2, line_end) if middle != -1 else -1
+        if close == -1:
+            start = text.find("[", start + 1)
+            continue
+        parts.append(text[copied:start])
+        parts.append(text[start + 1 : middle])
+        copied = close + 1
+        start = text.find("[", copied)
+    parts.append(text[copied:])
+    return "".join(parts)
+
+
+def _dump_payload(payload: Dict[str, Any]) -> str:
+    """Serializes a request payload, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
@@ -8,6 +8,11 @@ from typing import List, Optional
 
 from core.models import SearchTask
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None  # type: ignore
+
 
 @dataclass
 class SearchSummary:
@@ -38,5 +43,7 @@ def build_performance_report(
         ],
         "user_feedback": user_feedback or "",
     }
-    return json.dumps(report, indent=2)
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(report, indent=2, ensure_ascii=False)
 
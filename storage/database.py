@@ -2,34 +2,55 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Mapping, Tuple, Union
 
 from core.models import NormalizedRow
 
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - falls back to hashlib.blake2b
+    xxhash = None  # type: ignore
+
 
 class InMemoryDatabase:
     """Stores normalized rows while enforcing deduplication."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, exact_keys: bool = False) -> None:
         self._rows: List[NormalizedRow] = []
-        self._seen: set[Tuple[str, ...]] = set()
+        # 128-bit fingerprints keep no key strings alive; exact_keys stores
+        # the key tuples themselves for debugging.
+        self._exact_keys = exact_keys
+        self._seen: set[Union[int, Tuple[str, ...]]] = set()
         self._logger = logging.getLogger(self.__class__.__name__)
 
     def insert(self, row: NormalizedRow) -> None:
         """Inserts a row unless it has already been observed."""
-        key = self._build_key(row)
-        if key in self._seen:
-            self._logger.debug("Skipping duplicate row with key %s.", key)
-            return
-        self._seen.add(key)
-        self._rows.append(row)
-        self._logger.debug("Inserted row with key %s.", key)
+        self.extend((row,))
 
     def extend(self, rows: Iterable[NormalizedRow]) -> None:
-        """Inserts multiple rows."""
-        for row in rows:
-            self.insert(row)
+        """Inserts multiple rows, skipping any already observed."""
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        seen = self._seen
+        build_key = self._build_key
+        exact_keys = self._exact_keys
+        accepted: List[NormalizedRow] = []
+        try:
+            for row in rows:
+                key = build_key(row)
+                seen_key = key if exact_keys else _fingerprint(key)
+                if seen_key in seen:
+                    if debug:
+                        self._logger.debug("Skipping duplicate row with key %s.", key)
+                    continue
+                seen.add(seen_key)
+                accepted.append(row)
+                if debug:
+                    self._logger.debug("Inserted row with key %s.", key)
+        finally:
+            # Rows whose keys were recorded are kept even if a later row fails.
+            self._rows.extend(accepted)
 
     def rows(self) -> List[NormalizedRow]:
         """Returns stored rows."""
@@ -41,26 +62,9 @@ class InMemoryDatabase:
 
     def _build_key(self, row: NormalizedRow) -> Tuple[str, ...]:
         """Builds a deduplication key following the architecture."""
-        url = (
-            row.values.get("url")
-            or row.values.get("link")
-            or ""
-        ).strip().lower()
+        url, title, source, description = _extract_dedup_fields(row.values)
         if url:
             return ("url", url)
-
-        title = (
-            row.values.get("title")
-            or row.values.get("name")
-            or ""
-        ).strip().lower()
-        source = (
-            row.values.get("source")
-            or row.values.get("source_domain")
-            or ""
-        ).strip().lower()
-        description = (row.values.get("description") or "").strip().lower()
-
         if title and source:
             return ("title_source", title, source)
         if title and description:
@@ -73,3 +77,30 @@ class InMemoryDatabase:
             description[:100],
         )
 
+
+def _extract_dedup_fields(values: Mapping[str, str]) -> Tuple[str, str, str, str]:
+    """Returns the normalized (url, title, source, description) key fields.
+
+    Rows with a URL are keyed on it alone, so the other fields are skipped.
+    """
+    get = values.get
+    url = get("url") or get("link")
+    if url and (url := url.strip().lower()):
+        return url, "", "", ""
+    title = get("title") or get("name") or ""
+    source = get("source") or get("source_domain") or ""
+    description = get("description") or ""
+    return (
+        "",
+        title.strip().lower(),
+        source.strip().lower(),
+        description.strip().lower(),
+    )
+
+
+def _fingerprint(key: Tuple[str, ...]) -> int:
+    """Hashes a key tuple to a 128-bit integer, using xxhash when installed."""
+    data = "\x00".join(key).encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_128_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), "big")
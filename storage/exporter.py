@@ -5,10 +5,13 @@ from __future__ import annotations
 import csv
 import time
 from pathlib import Path
-from typing import Iterable, Mapping, Sequence
+from typing import Iterable, List, Mapping, Sequence
 
 from core.models import NormalizedRow
 
+# Exports are written in one pass, so a large buffer keeps syscalls rare.
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class CSVExporter:
     """Writes normalized rows to a CSV file."""
@@ -25,14 +28,27 @@ class CSVExporter:
         filename_prefix: str = "output",
     ) -> Path:
         """Exports rows to a timestamped CSV."""
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        file_path = self._export_dir / f"{filename_prefix}_{timestamp}.csv"
-        with file_path.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=list(columns))
-            writer.writeheader()
-            for row in rows:
-                row_dict = row.as_dict(columns)
-                writer.writerow({column: row_dict.get(column, "") for column in columns})
+        file_path = self._new_path(filename_prefix)
+        columns = list(columns)
+        # as_dict() overrides these columns with the row's own metadata.
+        query_id_at = [i for i, c in enumerate(columns) if c == "source_query_id"]
+        strategy_at = [i for i, c in enumerate(columns) if c == "source_strategy"]
+
+        def cells(row: NormalizedRow) -> List[str]:
+            get = row.values.get
+            line = [get(column, "") for column in columns]
+            for index in query_id_at:
+                line[index] = row.source_query_id
+            for index in strategy_at:
+                line[index] = row.source_strategy
+            return line
+
+        with file_path.open(
+            "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+        ) as handle:
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            writer.writerows(map(cells, rows))
         return file_path
 
     def export_dicts(
@@ -43,21 +59,26 @@ class CSVExporter:
         filename_prefix: str = "output",
     ) -> Path:
         """Exports generic mapping records to CSV."""
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        file_path = self._export_dir / f"{filename_prefix}_{timestamp}.csv"
-        with file_path.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=list(columns))
-            writer.writeheader()
-            for record in records:
-                row = {column: _stringify(record.get(column, "")) for column in columns}
-                writer.writerow(row)
+        file_path = self._new_path(filename_prefix)
+        columns = list(columns)
+        with file_path.open(
+            "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+        ) as handle:
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            # csv.writer already renders None as "" and str()s other values.
+            writer.writerows(
+                [record.get(column, "") for column in columns] for record in records
+            )
         return file_path
 
-
-def _stringify(value: object) -> str:
-    """Converts a mapping value into a safe string for CSV export."""
-    if value is None:
-        return ""
-    if isinstance(value, (int, float)):
-        return str(value)
-    return str(value)
+    def _new_path(self, filename_prefix: str) -> Path:
+        """Returns a timestamped path unique to the nanosecond."""
+        now_ns = time.time_ns()
+        timestamp = time.strftime(
+            "%Y%m%d_%H%M%S", time.localtime(now_ns // 1_000_000_000)
+        )
+        return (
+            self._export_dir
+            / f"{filename_prefix}_{timestamp}_{now_ns % 1_000_000_000:09d}.csv"
+        )
@@ -0,0 +1,56 @@
+"""Tests for configuration loading and directory setup."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from config import get_config, reset_config
+
+
+class ConfigDirectoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self._env = dict(os.environ)
+        os.environ.update(
+            EXPORT_DIR=str(self.root / "data"),
+            REPORTS_DIR=str(self.root / "reports"),
+            PROMPTS_DIR=str(self.root / "prompts"),
+        )
+        reset_config()
+
+    def tearDown(self) -> None:
+        os.environ.clear()
+        os.environ.update(self._env)
+        reset_config()
+        self._tmp.cleanup()
+
+    def test_reset_recreates_deleted_directories(self) -> None:
+        config = get_config()
+        shutil.rmtree(config.paths.export_dir)
+        reset_config()
+        config = get_config()
+        self.assertTrue(config.paths.export_dir.is_dir())
+        self.assertTrue(config.paths.debug_export_dir.is_dir())
+
+    def test_file_in_place_of_directory_is_rejected(self) -> None:
+        (self.root / "reports").write_text("not a directory")
+        with self.assertRaises(NotADirectoryError):
+            get_config()
+
+    def test_cache_path_parents_are_created(self) -> None:
+        os.environ.update(
+            LLM_CACHE_PATH=str(self.root / "llm_cache" / "cache.db"),
+            SCHEMA_CACHE_PATH=str(self.root / "schema_cache" / "schemas.json"),
+        )
+        config = get_config()
+        self.assertTrue(config.paths.llm_cache_path.parent.is_dir())
+        self.assertTrue(config.paths.schema_cache_path.parent.is_dir())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+"""Tests for SearchExecutor batched submission."""
+
+from __future__ import annotations
+
+import json
+import unittest
+from concurrent.futures import CancelledError, Future
+from typing import Any, Dict, List, Optional
+
+from core.llm_client import LLMResult
+from core.models import SearchTask
+from search.executor import SearchExecutor
+
+SCHEMA = ["name", "url"]
+
+
+class _Models:
+    def for_web(self) -> str:
+        return "web-model"
+
+
+class _FutureLLM:
+    """Hands out one controllable future per step; preset texts resolve at once."""
+
+    def __init__(self, texts: Optional[Dict[str, str]] = None) -> None:
+        self.futures: Dict[str, Future[LLMResult]] = {}
+        self._texts = texts or {}
+
+    def submit(self, *, step_name: str, **_: Any) -> Future[LLMResult]:
+        future: Future[LLMResult] = Future()
+        self.futures[step_name] = future
+        if step_name in self._texts:
+            future.set_result(LLMResult(text=self._texts[step_name], raw={}))
+        return future
+
+
+def _tasks(count: int) -> List[SearchTask]:
+    return [
+        SearchTask(id=f"t{index}", query=f"q{index}", strategy="web")
+        for index in range(1, count + 1)
+    ]
+
+
+def _items(name: str) -> List[Dict[str, str]]:
+    return [{"name": name, "url": f"https://{name}.example/about"}]
+
+
+def _batch_text(*task_ids: str) -> str:
+    results = [{"query_id": task_id, "items": _items(task_id)} for task_id in task_ids]
+    return json.dumps({"results": results})
+
+
+def _result(text: str) -> LLMResult:
+    return LLMResult(text=text, raw={})
+
+
+class SubmitBatchTestCase(unittest.TestCase):
+    def _executor(self, llm: _FutureLLM) -> SearchExecutor:
+        return SearchExecutor(llm, _Models(), {}, cache_enabled=False)
+
+    def test_run_batch_returns_rows_by_task_id(self) -> None:
+        llm = _FutureLLM({"web_batch_t1": _batch_text("t1", "t2")})
+
+        rows = self._executor(llm).run_batch(_tasks(2), SCHEMA)
+
+        self.assertEqual(set(rows), {"t1", "t2"})
+        self.assertEqual(rows["t2"][0].values["name"], "t2")
+        self.assertEqual(rows["t2"][0].source_query_id, "t2")
+        self.assertEqual(list(llm.futures), ["web_batch_t1"])
+
+    def test_partial_response_resubmits_missing_task(self) -> None:
+        llm = _FutureLLM()
+        futures = self._executor(llm).submit_batch(_tasks(3), SCHEMA)
+
+        llm.futures["web_batch_t1"].set_result(_result(_batch_text("t1", "t2")))
+
+        self.assertEqual(futures["t1"].result(timeout=1)[0].values["name"], "t1")
+        self.assertEqual(futures["t2"].result(timeout=1)[0].values["name"], "t2")
+        self.assertFalse(futures["t3"].done())
+        llm.futures["web_t3"].set_result(
+            _result(json.dumps({"items": _items("alone")}))
+        )
+        self.assertEqual(futures["t3"].result(timeout=1)[0].values["name"], "alone")
+
+    def test_failed_retry_only_fails_missing_task(self) -> None:
+        llm = _FutureLLM()
+        futures = self._executor(llm).submit_batch(_tasks(2), SCHEMA)
+
+        llm.futures["web_batch_t1"].set_result(_result(_batch_text("t1")))
+        llm.futures["web_t2"].set_exception(RuntimeError("timeout"))
+
+        self.assertEqual(len(futures["t1"].result(timeout=1)), 1)
+        with self.assertRaisesRegex(RuntimeError, "timeout"):
+            futures["t2"].result(timeout=1)
+
+    def test_llm_exception_fails_every_task(self) -> None:
+        llm = _FutureLLM()
+        futures = self._executor(llm).submit_batch(_tasks(3), SCHEMA)
+
+        llm.futures["web_batch_t1"].set_exception(RuntimeError("rate limited"))
+
+        for future in futures.values():
+            with self.assertRaisesRegex(RuntimeError, "rate limited"):
+                future.result(timeout=1)
+        self.assertEqual(list(llm.futures), ["web_batch_t1"])
+
+    def test_cancelling_every_task_cancels_request(self) -> None:
+        llm = _FutureLLM()
+        futures = self._executor(llm).submit_batch(_tasks(3), SCHEMA)
+        request = llm.futures["web_batch_t1"]
+
+        futures["t1"].cancel()
+        futures["t2"].cancel()
+        self.assertFalse(request.cancelled())
+        futures["t3"].cancel()
+
+        self.assertTrue(request.cancelled())
+        for future in futures.values():
+            with self.assertRaises(CancelledError):
+                future.result(timeout=1)
+
+    def test_cancelled_task_is_skipped_when_response_arrives(self) -> None:
+        llm = _FutureLLM()
+        futures = self._executor(llm).submit_batch(_tasks(2), SCHEMA)
+
+        futures["t2"].cancel()
+        llm.futures["web_batch_t1"].set_result(_result(_batch_text("t1")))
+
+        self.assertEqual(len(futures["t1"].result(timeout=1)), 1)
+        self.assertTrue(futures["t2"].cancelled())
+        self.assertNotIn("web_t2", llm.futures)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""Tests for CachedLLMClient lookup, expiry, refresh and validation."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest import mock
+
+from core.llm_cache import CachedLLMClient
+from core.llm_client import LLMResult
+
+MESSAGES = [{"role": "user", "content": "List companies."}]
+
+
+class _CountingClient:
+    """Returns a new numbered response on every call."""
+
+    def __init__(self, texts: List[str] | None = None) -> None:
+        self.calls: List[str] = []
+        self._texts = texts
+
+    def _next(self, step_name: str) -> LLMResult:
+        self.calls.append(step_name)
+        if self._texts is not None:
+            text = self._texts[len(self.calls) - 1]
+        else:
+            text = json.dumps({"ids": [f"q{len(self.calls)}"]})
+        return LLMResult(text=text, raw={"call": len(self.calls)})
+
+    def complete(self, *, step_name: str = "generic", **_: Any) -> LLMResult:
+        return self._next(step_name)
+
+    def submit(self, *, step_name: str = "generic", **_: Any) -> Future[LLMResult]:
+        future: Future[LLMResult] = Future()
+        future.set_result(self._next(step_name))
+        return future
+
+
+def _has_ids(text: str) -> bool:
+    return bool(json.loads(text).get("ids"))
+
+
+class CachedLLMClientTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "cache.db"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _cache(self, client: _CountingClient, **kwargs: Any) -> CachedLLMClient:
+        cache = CachedLLMClient(client, self.db_path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def _complete(self, cache: CachedLLMClient, step_name: str, **kwargs: Any) -> str:
+        return cache.complete(
+            model="m", messages=MESSAGES, step_name=step_name, **kwargs
+        ).text
+
+    def test_miss_calls_client_and_hit_replays(self) -> None:
+        client = _CountingClient()
+        cache = self._cache(client)
+        first = self._complete(cache, "schema")
+        second = self._complete(cache, "schema")
+        self.assertEqual(first, second)
+        self.assertEqual(client.calls, ["schema"])
+
+    def test_submit_hit_returns_resolved_future(self) -> None:
+        client = _CountingClient()
+        cache = self._cache(client)
+        first = cache.submit(model="m", messages=MESSAGES, step_name="generate_0")
+        second = cache.submit(model="m", messages=MESSAGES, step_name="generate_0")
+        self.assertTrue(second.done())
+        self.assertEqual(first.result().text, second.result().text)
+        self.assertEqual(len(client.calls), 1)
+
+    def test_entry_expires_after_step_ttl(self) -> None:
+        client = _CountingClient()
+        cache = self._cache(client, ttl_by_step={"filter": 60})
+        with mock.patch("core.llm_cache.time.time", return_value=1000.0):
+            first = self._complete(cache, "filter")
+        with mock.patch("core.llm_cache.time.time", return_value=1050.0):
+            self.assertEqual(self._complete(cache, "filter"), first)
+        with mock.patch("core.llm_cache.time.time", return_value=1061.0):
+            self.assertNotEqual(self._complete(cache, "filter"), first)
+        self.assertEqual(len(client.calls), 2)
+
+    def test_ttl_falls_back_to_step_prefix(self) -> None:
+        client = _CountingClient()
+        cache = self._cache(client, ttl_by_step={"generate": 60})
+        with mock.patch("core.llm_cache.time.time", return_value=1000.0):
+            self._complete(cache, "generate_3")
+        with mock.patch("core.llm_cache.time.time", return_value=1061.0):
+            self._complete(cache, "generate_3")
+        self.assertEqual(len(client.calls), 2)
+
+    def test_refresh_bypasses_lookup_and_replaces_entry(self) -> None:
+        client = _CountingClient()
+        cache = self._cache(client)
+        first = self._complete(cache, "filter")
+        refreshed = self._complete(cache, "filter", refresh=True)
+        self.assertNotEqual(first, refreshed)
+        self.assertEqual(self._complete(cache, "filter"), refreshed)
+        self.assertEqual(len(client.calls), 2)
+
+    def test_rejected_response_is_not_stored(self) -> None:
+        client = _CountingClient(
+            texts=['{"ids": []}', "not json", '{"ids": ["q1"]}', '{"ids": ["q2"]}']
+        )
+        cache = self._cache(client, validators={"filter": _has_ids})
+        self.assertEqual(self._complete(cache, "filter"), '{"ids": []}')
+        # A validator that raises counts as a rejection.
+        self.assertEqual(self._complete(cache, "filter"), "not json")
+        self.assertEqual(self._complete(cache, "filter"), '{"ids": ["q1"]}')
+        self.assertEqual(self._complete(cache, "filter"), '{"ids": ["q1"]}')
+        self.assertEqual(len(client.calls), 3)
+
+    def test_submit_applies_validator(self) -> None:
+        client = _CountingClient(texts=['{"ids": []}', '{"ids": ["q1"]}'])
+        cache = self._cache(client, validators={"generate": _has_ids})
+        outcomes: Dict[str, str] = {}
+        for attempt in ("first", "second", "third"):
+            future = cache.submit(model="m", messages=MESSAGES, step_name="generate_0")
+            outcomes[attempt] = future.result().text
+        self.assertEqual(outcomes["first"], '{"ids": []}')
+        self.assertEqual(outcomes["second"], outcomes["third"])
+        self.assertEqual(len(client.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+"""Tests for PipelineOrchestrator plan execution and incremental refinement."""
+
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from config import get_config, reset_config
+from core.llm_client import LLMResult
+from core.model_registry import ModelRegistry
+from core.models import NormalizedRow, SearchPlan, SearchTask, UserRequest
+from core.prompt_repository import PromptRepository
+from pipeline.orchestrator import PipelineOrchestrator
+from storage.database import InMemoryDatabase
+from storage.exporter import CSVExporter
+
+PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+
+
+def _row(name: str, query_id: str = "seed") -> NormalizedRow:
+    return NormalizedRow(
+        values={"name": name, "url": f"https://{name}.example"},
+        source_query_id=query_id,
+        source_strategy="web",
+    )
+
+
+class _StaggeredExecutor:
+    """Resolves the first submitted task at once and later ones after delays."""
+
+    def __init__(self) -> None:
+        self._submitted = 0
+
+    def submit_batch(
+        self, tasks: Sequence[SearchTask], schema: Sequence[str]
+    ) -> Dict[str, Future]:
+        futures = {}
+        for task in tasks:
+            future: Future = Future()
+            futures[task.id] = future
+            delay = 0.05 * self._submitted
+            self._submitted += 1
+            threading.Thread(
+                target=self._resolve, args=(future, task, delay), daemon=True
+            ).start()
+        return futures
+
+    @staticmethod
+    def _resolve(future: Future, task: SearchTask, delay: float) -> None:
+        time.sleep(delay)
+        if future.set_running_or_notify_cancel():
+            future.set_result([_row(task.id, task.id)])
+
+
+class _SlicingRefiner:
+    """Refiner stub that echoes row names and records each batch size."""
+
+    max_records = 3
+
+    def __init__(self) -> None:
+        self.batch_sizes: List[int] = []
+
+    def refine(self, rows, request, schema):
+        rows = list(rows)[: self.max_records]
+        self.batch_sizes.append(len(rows))
+        return [{"name": row.values["name"]} for row in rows]
+
+    def merge_records(self, existing, additions, request):
+        return [*existing, *additions]
+
+
+class _StatusIO:
+    def display_status(self, message: str) -> None:
+        pass
+
+
+class _RecordingLLM:
+    """Records generation prompts and answers with an empty batch."""
+
+    def __init__(self) -> None:
+        self.system_prompts: List[str] = []
+
+    def submit(self, *, messages, **_) -> "Future[LLMResult]":
+        self.system_prompts.append(messages[0]["content"])
+        future: Future[LLMResult] = Future()
+        future.set_result(LLMResult(text='{"searches": []}', raw={}))
+        return future
+
+
+class OrchestratorTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = dict(os.environ)
+        os.environ.update(
+            EXPORT_DIR=str(Path(self._tmp.name) / "data"),
+            REPORTS_DIR=str(Path(self._tmp.name) / "reports"),
+            PROMPTS_DIR=str(PROMPTS_DIR),
+            USE_LLM_CACHE="false",
+        )
+        reset_config()
+        self.config = get_config()
+        self.db = InMemoryDatabase()
+        self.refiner = _SlicingRefiner()
+
+    def tearDown(self) -> None:
+        os.environ.clear()
+        os.environ.update(self._env)
+        reset_config()
+        self._tmp.cleanup()
+
+    def _orchestrator(self, executor=None, llm_client=None) -> PipelineOrchestrator:
+        orchestrator = PipelineOrchestrator(
+            config=self.config,
+            prompt_repository=PromptRepository(self.config.paths.prompts_dir),
+            llm_client=llm_client,
+            model_registry=ModelRegistry(self.config.models),
+            search_executor=executor,
+            db=self.db,
+            debug_exporter=CSVExporter(self.config.paths.debug_export_dir),
+            report_exporter=CSVExporter(self.config.paths.reports_dir),
+            refiner=self.refiner,
+            io=_StatusIO(),
+        )
+        self.addCleanup(orchestrator.close)
+        return orchestrator
+
+    def test_retry_round_ignores_rows_from_earlier_rounds(self) -> None:
+        self.db.extend(_row(f"old{index}") for index in range(25))
+        orchestrator = self._orchestrator(_StaggeredExecutor())
+        plan = SearchPlan(
+            SearchTask(id=f"t{index}", query=f"q{index}", strategy="web")
+            for index in range(1, 6)
+        )
+
+        result = orchestrator._execute_plan(
+            plan, ["name"], UserRequest(description="d", min_items=10)
+        )
+
+        self.assertEqual(
+            sorted(summary.task.id for summary in result.summaries),
+            ["t1", "t2", "t3", "t4", "t5"],
+        )
+        self.assertEqual(self.db.count(), 30)
+
+    def test_refine_collected_covers_rows_past_max_records(self) -> None:
+        self.db.extend(_row(f"co{index}") for index in range(8))
+        orchestrator = self._orchestrator()
+        request = UserRequest(description="d", min_items=5)
+
+        refined = orchestrator._refine_collected(request, ["name"])
+
+        self.assertEqual(
+            [record["name"] for record in refined],
+            [f"co{index}" for index in range(8)],
+        )
+        self.assertEqual(self.refiner.batch_sizes, [3, 3, 2])
+        self.db.extend([_row("late")])
+        refined = orchestrator._refine_collected(request, ["name"])
+        self.assertEqual(refined[-1]["name"], "late")
+        self.assertEqual(self.refiner.batch_sizes, [3, 3, 2, 1])
+
+    def test_micro_batches_sum_to_per_batch(self) -> None:
+        llm = _RecordingLLM()
+        orchestrator = self._orchestrator(llm_client=llm)
+        per_batch = self.config.limits.per_batch
+
+        orchestrator._generate_batches_concurrently(
+            UserRequest(description="d", min_items=5), 1
+        )
+
+        requested = [
+            int(re.search(r"Generate (\d+) distinct", prompt).group(1))
+            for prompt in llm.system_prompts
+        ]
+        self.assertEqual(len(requested), 2)
+        self.assertEqual(sum(requested), per_batch)
+        self.assertLessEqual(max(requested) - min(requested), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
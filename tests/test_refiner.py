@@ -0,0 +1,38 @@
+"""Tests for refiner helpers."""
+
+from __future__ import annotations
+
+import unittest
+from urllib.parse import urlparse
+
+from postprocess.refiner import _extract_domain
+
+
+def _urlparse_domain(url: str) -> str:
+    parsed = urlparse(url)
+    return (parsed.netloc or parsed.path).lower()
+
+
+class ExtractDomainTestCase(unittest.TestCase):
+    def test_matches_urlparse_for_delimited_inputs(self) -> None:
+        for url in (
+            "localhost:8080",
+            "mailto:x",
+            "foo?bar",
+            "foo#frag",
+            "foo;params",
+            " Example",
+            "a\tb",
+            "https://Example.com/path",
+            "example.com",
+            "Acme",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(_extract_domain(url), _urlparse_domain(url))
+
+    def test_empty_string(self) -> None:
+        self.assertEqual(_extract_domain(""), "")
+
+
+if __name__ == "__main__":
+    unittest.main()